@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
 """Interactive Terminal Art Gallery — 6 generative art animations in pure Python."""
 
+import time
+
+STARTED = time.perf_counter()  # start of module import, for --startup-profile
+
+import argparse
+import bisect
 import curses
+import json
 import math
+import os
 import random
-import time
+import struct
+import sys
+import zlib
+from array import array
+from collections import deque
+
+# NumPy module while the vectorized backend is enabled, see enable_numpy()
+np = None
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -13,8 +28,72 @@ import time
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))
 
-def init_colors(stdscr):
-    """Set up color pairs. Returns True if 256-color mode is available."""
+def headless_color_pair(n):
+    """Stand-in for curses.color_pair() when no terminal has been initialised."""
+    return (n << 8) & curses.A_COLOR
+
+# Rebound to headless_color_pair() by the headless tools (benchmark etc.)
+color_pair = curses.color_pair
+
+def use_headless_colors():
+    global color_pair
+    color_pair = headless_color_pair
+
+def enable_numpy():
+    """Switch grid exhibits to their vectorized paths if NumPy is installed.
+
+    Must be called before exhibits are constructed. Returns False (and keeps
+    the pure-Python paths) when NumPy is missing.
+    """
+    global np
+    try:
+        import numpy
+    except ImportError:  # optional, imported here to keep it off the startup path
+        return False
+    np = numpy
+    return True
+
+# Seed of the exhibits' random streams, see seed_exhibits(); None seeds from the OS
+exhibit_seed = None
+
+def seed_exhibits(seed):
+    """Make every exhibit constructed from now on reproducible from `seed`."""
+    global exhibit_seed
+    exhibit_seed = seed
+
+def exhibit_rng(cls):
+    """A random stream of the exhibit's own.
+
+    Each exhibit class derives its stream from the seed and its name, so a
+    run of one exhibit does not depend on which others ran before it.
+    """
+    if exhibit_seed is None:
+        return random.Random()
+    return random.Random(f"{exhibit_seed}:{cls.__name__}")
+
+def blit_arrays(stdscr, chars, attrs, y0=0):
+    """Write 2-D NumPy glyph/attr arrays into a CellBuffer, row by row."""
+    for y, (row_chars, row_attrs) in enumerate(zip(chars.tolist(), attrs.tolist()), y0):
+        stdscr.blit(y, 0, row_chars, row_attrs)
+
+# 256-colour palettes: name -> (first pair number, foreground colours)
+PALETTES = {
+    # green shades for matrix
+    "greens": (10, [22, 28, 34, 40, 46, 82, 118, 154, 190, 226]),
+    # rainbow for plasma / fireworks
+    "rainbow": (50, [196, 202, 208, 214, 220, 226, 190, 154, 118, 82,
+                     46, 47, 48, 49, 50, 51, 45, 39, 33, 27,
+                     21, 57, 93, 129, 165, 201, 200, 199, 198, 197]),
+    # firework burst colors
+    "burst": (100, [196, 208, 226, 46, 51, 21, 201, 231, 214, 118]),
+}
+
+def init_colors(stdscr, palettes=PALETTES):
+    """Set up color pairs. Returns True if 256-color mode is available.
+
+    Only the named 256-color palettes are set up; the others can follow
+    later through init_palettes(), e.g. once the first frame is on screen.
+    """
     curses.start_color()
     curses.use_default_colors()
     has256 = curses.COLORS >= 256
@@ -22,80 +101,410 @@ def init_colors(stdscr):
     for i in range(1, 8):
         curses.init_pair(i, i, -1)
     if has256:
-        # Pairs 10-49: green shades for matrix
-        greens = [22, 28, 34, 40, 46, 82, 118, 154, 190, 226]
-        for idx, c in enumerate(greens):
-            curses.init_pair(10 + idx, c, -1)
-        # Pairs 50-99: rainbow for plasma / fireworks
-        rainbow = [196, 202, 208, 214, 220, 226, 190, 154, 118, 82,
-                   46, 47, 48, 49, 50, 51, 45, 39, 33, 27,
-                   21, 57, 93, 129, 165, 201, 200, 199, 198, 197]
-        for idx, c in enumerate(rainbow):
-            curses.init_pair(50 + idx, c, -1)
-        # Pairs 100-109: firework burst colors
-        burst = [196, 208, 226, 46, 51, 21, 201, 231, 214, 118]
-        for idx, c in enumerate(burst):
-            curses.init_pair(100 + idx, c, -1)
+        init_palettes(palettes)
+    palette(has256)
     return has256
 
+def init_palettes(names):
+    """Set up the color pairs of the named 256-color palettes; only call
+    this when the terminal has 256 colors."""
+    for name in names:
+        first, colors = PALETTES[name]
+        for idx, c in enumerate(colors):
+            curses.init_pair(first + idx, c, -1)
+
+
+# (char, attr) shading tables by color mode, see palette()
+_palettes = {}
+
+def build_palette(has256):
+    """Precompute the shading table of every exhibit that has one.
+
+    An exhibit with LEVELS and a shade(v, has256) classmethod gets 2 * LEVELS
+    + 2 (char, attr) pairs, looked up by shade_level(v * LEVELS) for
+    intensity v in [0, 1]. Even entries shade the level boundaries i / LEVELS
+    themselves and odd entries the open steps between them, so a threshold
+    on a boundary shades exactly like shade() whether it is tested with < or
+    >. LEVELS is chosen so every threshold of the exhibit's shading falls on
+    a level boundary. Only needs color_pair(), so it works headless too.
+    """
+    tables = {}
+    for cls in EXHIBITS:
+        if hasattr(cls, "shade"):
+            n = 2 * cls.LEVELS
+            tables[cls] = [cls.shade(min(i / n, 1.0), has256) for i in range(n + 2)]
+    return tables
+
+
+def shade_level(x):
+    """Shading table entry for x = v * LEVELS: 2i at x == i, 2i + 1 between
+    i and i + 1. Takes NumPy arrays as well."""
+    if np is not None and isinstance(x, np.ndarray):
+        return np.floor(x).astype(int) + np.ceil(x).astype(int)
+    i = int(x)
+    return i + i + (x > i)
+
+def palette(has256):
+    """Shading tables shared by all exhibits, built once per color mode."""
+    if has256 not in _palettes:
+        _palettes[has256] = build_palette(has256)
+    return _palettes[has256]
+
+
+# ---------------------------------------------------------------------------
+# Screen buffer
+# ---------------------------------------------------------------------------
+
+class CellBuffer:
+    """In-memory (char, attr) framebuffer with the drawing surface of stdscr.
+
+    Exhibits draw into it instead of into curses. present() then diffs it
+    against what was last sent to the terminal and writes only the cells
+    that changed, a run of same-attribute cells per call, so a mostly
+    static frame costs a handful of curses calls.
+    It also stands in for stdscr when running headless (benchmark). Writes
+    outside the buffer raise curses.error just like curses does, including
+    the quirk that filling the bottom-right cell raises after writing it.
+    """
+
+    def __init__(self, h, w):
+        self.resize(h, w)
+
+    def resize(self, h, w):
+        self.h, self.w = h, w
+        self.chars = [" "] * (h * w)
+        self.attrs = [0] * (h * w)
+        # what the terminal shows, as of the last present()
+        self.front_chars = [" "] * (h * w)
+        self.front_attrs = [0] * (h * w)
+        self.calls = 0    # drawing calls received
+        self.changed = 0  # cells that differed from the terminal at the last present()
+        self.written = 0  # cells sent to the terminal by the last present()
+
+    def getmaxyx(self):
+        return self.h, self.w
+
+    def erase(self):
+        n = self.h * self.w
+        self.chars[:] = [" "] * n
+        self.attrs[:] = [0] * n
+
+    clear = erase
+
+    def addch(self, y, x, ch, attr=0):
+        self.calls += 1
+        if not (0 <= y < self.h and 0 <= x < self.w):
+            raise curses.error("addch() returned ERR")
+        i = y * self.w + x
+        self.chars[i] = ch
+        self.attrs[i] = attr
+        if i == self.h * self.w - 1:
+            raise curses.error("addch() returned ERR")
+
+    def addnstr(self, y, x, s, n, attr=0):
+        self.addstr(y, x, s[:n], attr)
+
+    def addstr(self, y, x, s, attr=0):
+        self.calls += 1
+        if not (0 <= y < self.h and 0 <= x < self.w):
+            raise curses.error("addstr() returned ERR")
+        i = y * self.w + x
+        end = min(i + len(s), self.h * self.w)
+        self.chars[i:end] = s[:end - i]
+        self.attrs[i:end] = [attr] * (end - i)
+        if end == self.h * self.w:
+            raise curses.error("addstr() returned ERR")
+
+    def blit(self, y, x, chars, attrs):
+        """Write a row of cells starting at (y, x), clipped to the buffer."""
+        self.calls += 1
+        if not (0 <= y < self.h and 0 <= x < self.w):
+            return
+        n = min(len(chars), self.w - x)
+        i = y * self.w + x
+        self.chars[i:i + n] = chars[:n]
+        self.attrs[i:i + n] = attrs[:n]
+
+    def vblit(self, y, x, chars, attrs):
+        """Write a column of cells downward from (y, x), clipped to the buffer."""
+        self.calls += 1
+        if not (0 <= y < self.h and 0 <= x < self.w):
+            return
+        n = min(len(chars), self.h - y)
+        i, w = y * self.w + x, self.w
+        self.chars[i:i + n * w:w] = chars[:n]
+        self.attrs[i:i + n * w:w] = attrs[:n]
+
+    def invalidate(self):
+        """Forget what the terminal shows; the next present() rewrites it all."""
+        self.front_chars = [None] * (self.h * self.w)
+        self.front_attrs = [None] * (self.h * self.w)
+
+    def present(self, stdscr):
+        """Send the cells that differ from the previous frame to stdscr.
+
+        Changed cells are grouped into runs of one attribute, each written
+        with a single addstr(). A run carries on over unchanged cells of its
+        attribute up to its last changed cell, as rewriting them is cheaper
+        than starting another call.
+        """
+        w = self.w
+        chars, attrs = self.chars, self.attrs
+        fchars, fattrs = self.front_chars, self.front_attrs
+        changed = written = 0
+        last = self.h * w
+        for y in range(self.h):
+            a, b = y * w, y * w + w
+            if chars[a:b] == fchars[a:b] and attrs[a:b] == fattrs[a:b]:
+                continue
+            i = a
+            while i < b:
+                if chars[i] == fchars[i] and attrs[i] == fattrs[i]:
+                    i += 1
+                    continue
+                attr = attrs[i]
+                end = j = i + 1
+                changed += 1
+                while j < b and attrs[j] == attr:
+                    if chars[j] != fchars[j] or attr != fattrs[j]:
+                        changed += 1
+                        end = j + 1
+                    j += 1
+                if end == last:
+                    # writing the bottom-right cell raises after writing it
+                    try:
+                        stdscr.addstr(y, i - a, "".join(chars[i:end]), attr)
+                    except curses.error:
+                        pass
+                else:
+                    stdscr.addstr(y, i - a, "".join(chars[i:end]), attr)
+                written += end - i
+                i = j
+            fchars[a:b] = chars[a:b]
+            fattrs[a:b] = attrs[a:b]
+        self.changed = changed
+        self.written = written
+
+    def refresh(self):
+        pass
+
+    noutrefresh = refresh
+
+    def row_text(self, y):
+        return "".join(self.chars[y * self.w:(y + 1) * self.w])
+
+
+class GlowBuffer:
+    """Sparse decaying intensity field, e.g. phosphor or particle trails.
+
+    Only cells brighter than `floor` are stored, each with the frame it was
+    last written. Decay is applied when a cell is read, as
+    v * decay ** (now - last), so a frame costs time in proportion to the
+    lit cells rather than the screen area.
+    """
+
+    def __init__(self, decay, floor=0.05):
+        self.decay = decay
+        self.floor = floor
+        self.cells = {}  # key -> (value when last written, frame written)
+        self.now = 0
+        # decay ** age for every age at which a full-strength cell is visible
+        self.fade = [1.0]
+        while self.fade[-1] > floor:
+            self.fade.append(decay ** len(self.fade))
+
+    def clear(self):
+        self.cells.clear()
+
+    def tick(self):
+        """Advance one frame; every stored cell decays once."""
+        self.now += 1
+
+    def value(self, key):
+        v, t = self.cells.get(key, (0.0, self.now))
+        age = self.now - t
+        return v * self.fade[age] if age < len(self.fade) else 0.0
+
+    def add(self, key, amount, cap=1.0):
+        self.cells[key] = (min(cap, self.value(key) + amount), self.now)
+
+    def lit(self):
+        """Return (key, value) for every visible cell and forget the rest."""
+        now, fade, floor = self.now, self.fade, self.floor
+        n = len(fade)
+        out = []
+        dead = []
+        for key, (v, t) in self.cells.items():
+            age = now - t
+            if age < n:
+                v *= fade[age]
+                if v > floor:
+                    out.append((key, v))
+                    continue
+            dead.append(key)
+        for key in dead:
+            del self.cells[key]
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Particle pools
+# ---------------------------------------------------------------------------
+
+class ParticlePool:
+    """Particles stored column-wise, with recycled slots.
+
+    Fields are declared with array typecodes ("d" float, "i" int), e.g.
+    ParticlePool(x="d", y="d", life="i"), and each becomes a column indexed
+    by slot. Columns are lists, which CPython indexes faster than
+    array.array; a `vectorized` pool uses typed NumPy columns instead when
+    the NumPy backend is on, so whole columns can be updated at once.
+
+    Dead slots go on a free list and are reused by spawn(), so a steady
+    stream of particles allocates nothing per particle. `alive` lists the
+    slots in use in spawn order, which is also the order they are drawn in;
+    update loops compact survivors to its front and push dead slots onto
+    `free`.
+    """
+
+    def __init__(self, vectorized=False, **fields):
+        self.fields = fields
+        self.vectorized = vectorized and np is not None
+        self.clear()
+
+    def __len__(self):
+        return len(self.alive)
+
+    def clear(self):
+        for name, code in self.fields.items():
+            if self.vectorized:
+                setattr(self, name, np.zeros(64, dtype=float if code == "d" else np.int64))
+            else:
+                setattr(self, name, [])
+        self.size = 0  # slots ever handed out
+        self.alive = []
+        self.free = []
+
+    def spawn(self, **values):
+        """Add a particle and return its slot; omitted fields are 0."""
+        if self.free:
+            slot = self.free.pop()
+        else:
+            slot = self.size
+            self.size += 1
+            for name in self.fields:
+                column = getattr(self, name)
+                if not self.vectorized:
+                    column.append(0)
+                elif slot == len(column):
+                    setattr(self, name, np.concatenate((column, np.zeros_like(column))))
+        for name in self.fields:
+            getattr(self, name)[slot] = values.get(name, 0)
+        self.alive.append(slot)
+        return slot
+
 
 # ---------------------------------------------------------------------------
 # Animation: Matrix Rain
 # ---------------------------------------------------------------------------
 
 class MatrixRain:
+    """Falling glyph trails.
+
+    Each column keeps a buffer of one glyph per row that the trails passing
+    through it show. Glyphs are re-rolled in bulk, from one getrandbits()
+    call per step: a few glyphs of every trail plus its head, which keeps
+    flickering. Trail attributes are precomputed per trail length, so each
+    drop is drawn as a single column write.
+    """
     name = "Matrix Rain"
+    PALETTES = ("greens",)  # 256-color palettes used, see init_colors()
     CHARS = "abcdefghijklmnopqrstuvwxyz0123456789@#$%&*(){}[]<>?/\\|~"
+    GLYPHS = (CHARS * 5)[:256].encode()  # random byte -> glyph, for bytes.translate()
+    REFRESH = 4  # trail glyphs re-rolled per drop per step, besides the head
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
         self.reset()
 
     def reset(self):
-        self.drops = []
+        self.glyphs = [bytearray(self._noise(self.h)[0]) for _ in range(self.w)]
+        self.trails = {}  # length -> attrs from tail to head
+        self.drops = ParticlePool(x="i", y="i", speed="i", length="i")
         for x in range(self.w):
-            if random.random() < 0.4:
-                self.drops.append({"x": x, "y": random.randint(-self.h, 0),
-                                   "speed": random.randint(1, 3),
-                                   "length": random.randint(5, self.h // 2)})
+            if self.rng.random() < 0.4:
+                self.drops.spawn(x=x, y=self.rng.randint(-self.h, 0),
+                                 speed=self.rng.randint(1, 3),
+                                 length=self.rng.randint(5, self.h // 2))
+
+    def _noise(self, n):
+        """n random glyphs, and the random bytes they were made from."""
+        raw = self.rng.getrandbits(8 * n).to_bytes(n, "little") if n else b""
+        return raw.translate(self.GLYPHS), raw
+
+    def _trail(self, length):
+        attrs = []
+        for i in range(length):
+            if i == 0:
+                attr = color_pair(7) | curses.A_BOLD  # white head
+            elif self.has256:
+                shade = clamp(9 - (i * 10 // length), 0, 9)
+                attr = color_pair(10 + shade)
+            else:
+                attr = color_pair(2) | (curses.A_BOLD if i < length // 3 else 0)
+            attrs.append(attr)
+        attrs.reverse()
+        self.trails[length] = attrs
+        return attrs
 
     def resize(self, h, w):
         self.h, self.w = h, w
         self.reset()
 
+    def counts(self):
+        return {"drops": len(self.drops.alive)}
+
     def update(self):
-        for d in self.drops:
-            d["y"] += d["speed"]
-            if d["y"] - d["length"] > self.h:
-                d["y"] = random.randint(-self.h // 2, 0)
-                d["x"] = random.randint(0, self.w - 1)
-                d["speed"] = random.randint(1, 3)
-                d["length"] = random.randint(5, self.h // 2)
+        drops = self.drops
+        xs, ys, speeds, lengths = drops.x, drops.y, drops.speed, drops.length
+        for d in drops.alive:
+            ys[d] += speeds[d]
+            if ys[d] - lengths[d] > self.h:
+                ys[d] = self.rng.randint(-self.h // 2, 0)
+                xs[d] = self.rng.randint(0, self.w - 1)
+                speeds[d] = self.rng.randint(1, 3)
+                lengths[d] = self.rng.randint(5, self.h // 2)
         # occasionally spawn new drops
-        if random.random() < 0.3 and len(self.drops) < self.w:
-            self.drops.append({"x": random.randint(0, self.w - 1),
-                               "y": random.randint(-10, 0),
-                               "speed": random.randint(1, 3),
-                               "length": random.randint(5, self.h // 2)})
+        if self.rng.random() < 0.3 and len(drops) < self.w:
+            drops.spawn(x=self.rng.randint(0, self.w - 1),
+                        y=self.rng.randint(-10, 0),
+                        speed=self.rng.randint(1, 3),
+                        length=self.rng.randint(5, self.h // 2))
+        self._flicker()
+
+    def _flicker(self):
+        """Re-roll each drop's head glyph and a run of glyphs in its trail."""
+        drops, h, k = self.drops, self.h, self.REFRESH + 2
+        glyphs, raw = self._noise(len(drops.alive) * k)
+        for j, d in enumerate(drops.alive):
+            col, top, base = self.glyphs[drops.x[d]], drops.y[d], j * k
+            if 0 <= top < h:
+                col[top] = glyphs[base]
+            y0 = top - raw[base + 1] % drops.length[d]
+            a, b = max(0, y0), min(h, y0 + self.REFRESH)
+            if a < b:
+                col[a:b] = glyphs[base + 2 + a - y0:base + 2 + b - y0]
 
     def draw(self, stdscr):
-        for d in self.drops:
-            x = d["x"]
-            for i in range(d["length"]):
-                y = d["y"] - i
-                if 0 <= y < self.h and 0 <= x < self.w:
-                    ch = random.choice(self.CHARS) if i < 3 else self.CHARS[random.randint(0, len(self.CHARS) - 1)]
-                    if i == 0:
-                        attr = curses.color_pair(7) | curses.A_BOLD  # white head
-                    elif self.has256:
-                        shade = clamp(9 - (i * 10 // d["length"]), 0, 9)
-                        attr = curses.color_pair(10 + shade)
-                    else:
-                        attr = curses.color_pair(2) | (curses.A_BOLD if i < d["length"] // 3 else 0)
-                    try:
-                        stdscr.addch(y, x, ch, attr)
-                    except curses.error:
-                        pass
+        drops, h, trails = self.drops, self.h, self.trails
+        for d in drops.alive:
+            x, top, length = drops.x[d], drops.y[d], drops.length[d]
+            y0 = top - length + 1
+            a, b = max(0, y0), min(h, top + 1)
+            if a < b:
+                attrs = trails.get(length) or self._trail(length)
+                stdscr.vblit(a, x, self.glyphs[x][a:b].decode(), attrs[a - y0:b - y0])
 
 
 # ---------------------------------------------------------------------------
@@ -104,46 +513,59 @@ class MatrixRain:
 
 class Starfield:
     name = "Starfield"
+    PALETTES = ()
+    LEVELS = 10  # brightness steps in the shading table
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        self.shades = palette(has256)[Starfield]
         self.reset()
 
     def reset(self):
-        self.stars = []
+        self.stars = ParticlePool(x="d", y="d", z="d")
         for _ in range(120):
-            self.stars.append(self._new_star())
+            x, y, z = self._new_star()
+            self.stars.spawn(x=x, y=y, z=z)
 
     def _new_star(self):
-        return {"x": random.uniform(-1, 1), "y": random.uniform(-1, 1),
-                "z": random.uniform(0.1, 1.0)}
+        return self.rng.uniform(-1, 1), self.rng.uniform(-1, 1), self.rng.uniform(0.1, 1.0)
 
     def resize(self, h, w):
         self.h, self.w = h, w
 
+    def counts(self):
+        return {"stars": len(self.stars.alive)}
+
+    @classmethod
+    def shade(cls, brightness, has256):
+        if brightness > 0.8:
+            return "*", color_pair(7) | curses.A_BOLD
+        if brightness > 0.5:
+            return "+", color_pair(7)
+        if brightness > 0.2:
+            return ".", color_pair(6)
+        return ".", color_pair(0)
+
     def update(self):
-        for s in self.stars:
-            s["z"] -= 0.02
-            if s["z"] <= 0.005:
-                ns = self._new_star()
-                ns["z"] = 1.0
-                s.update(ns)
+        stars = self.stars
+        xs, ys, zs = stars.x, stars.y, stars.z
+        for s in stars.alive:
+            zs[s] -= 0.02
+            if zs[s] <= 0.005:
+                xs[s], ys[s], _ = self._new_star()
+                zs[s] = 1.0
 
     def draw(self, stdscr):
         cx, cy = self.w // 2, self.h // 2
-        for s in self.stars:
-            sx = int(cx + s["x"] / s["z"] * cx)
-            sy = int(cy + s["y"] / s["z"] * cy)
+        stars, shades, levels = self.stars, self.shades, self.LEVELS
+        xs, ys, zs = stars.x, stars.y, stars.z
+        for s in stars.alive:
+            z = zs[s]
+            sx = int(cx + xs[s] / z * cx)
+            sy = int(cy + ys[s] / z * cy)
             if 0 <= sy < self.h and 0 <= sx < self.w:
-                brightness = 1.0 - s["z"]
-                if brightness > 0.8:
-                    ch, attr = "*", curses.color_pair(7) | curses.A_BOLD
-                elif brightness > 0.5:
-                    ch, attr = "+", curses.color_pair(7)
-                elif brightness > 0.2:
-                    ch, attr = ".", curses.color_pair(6)
-                else:
-                    ch, attr = ".", curses.color_pair(0)
+                ch, attr = shades[shade_level((1.0 - z) * levels)]
                 try:
                     stdscr.addch(sy, sx, ch, attr)
                 except curses.error:
@@ -156,112 +578,178 @@ class Starfield:
 
 class Fireworks:
     name = "Fireworks"
+    PALETTES = ("burst",)
+    PARTICLES = 0  # stress mode: explode extra shells until this many are alive
+    COLORS = 10  # shell colours
+    LIFE = 25  # longest particle life in frames
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        self.rocket_attr = color_pair(7) | curses.A_BOLD
+        self.looks = [self._looks(c) for c in range(self.COLORS)]
+        if np is not None:
+            self.np_look_chars = np.array([[ch for ch, _ in row] for row in self.looks])
+            self.np_look_attrs = np.array([[attr for _, attr in row] for row in self.looks])
         self.reset()
 
+    def _looks(self, color):
+        """(char, attr) of a particle of this colour for each life left."""
+        base = color_pair(100 + color) if self.has256 else color_pair(1 + color % 7)
+        looks = []
+        for life in range(self.LIFE + 1):
+            if life > 15:
+                looks.append(("*", base | curses.A_BOLD))
+            elif life > 8:
+                looks.append(("+", base))
+            else:
+                looks.append((".", base))
+        return looks
+
     def reset(self):
-        self.rockets = []
-        self.particles = []
+        self.rockets = ParticlePool(x="d", y="d", vy="d", target_y="d")
+        self.particles = ParticlePool(vectorized=True, x="d", y="d", vx="d", vy="d",
+                                      life="i", color="i")
         self.tick = 0
 
     def resize(self, h, w):
         self.h, self.w = h, w
 
+    def counts(self):
+        return {"rockets": len(self.rockets.alive), "particles": len(self.particles.alive)}
+
     def _explode(self, x, y):
-        color = random.randint(0, 9)
-        count = random.randint(20, 40)
+        color = self.rng.randint(0, self.COLORS - 1)
+        count = self.rng.randint(20, 40)
+        spawn = self.particles.spawn
         for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.5, 2.5)
-            self.particles.append({
-                "x": x, "y": y,
-                "vx": math.cos(angle) * speed,
-                "vy": math.sin(angle) * speed - 0.5,
-                "life": random.randint(10, 25),
-                "color": color,
-            })
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(0.5, 2.5)
+            spawn(x=x, y=y,
+                  vx=math.cos(angle) * speed,
+                  vy=math.sin(angle) * speed - 0.5,
+                  life=self.rng.randint(10, self.LIFE),
+                  color=color)
 
     def update(self):
         self.tick += 1
         # launch rockets
-        if self.tick % 15 == 0 or (random.random() < 0.08):
-            self.rockets.append({
-                "x": random.uniform(self.w * 0.1, self.w * 0.9),
-                "y": float(self.h - 1),
-                "vy": -random.uniform(1.0, 2.0),
-                "target_y": random.uniform(self.h * 0.1, self.h * 0.5),
-            })
+        if self.tick % 15 == 0 or (self.rng.random() < 0.08):
+            self.rockets.spawn(
+                x=self.rng.uniform(self.w * 0.1, self.w * 0.9),
+                y=float(self.h - 1),
+                vy=-self.rng.uniform(1.0, 2.0),
+                target_y=self.rng.uniform(self.h * 0.1, self.h * 0.5),
+            )
         # move rockets
-        new_rockets = []
-        for r in self.rockets:
-            r["y"] += r["vy"]
-            if r["y"] <= r["target_y"]:
-                self._explode(r["x"], r["y"])
+        rockets = self.rockets
+        alive = rockets.alive
+        keep = 0
+        for r in alive:
+            rockets.y[r] += rockets.vy[r]
+            if rockets.y[r] <= rockets.target_y[r]:
+                self._explode(rockets.x[r], rockets.y[r])
+                rockets.free.append(r)
             else:
-                new_rockets.append(r)
-        self.rockets = new_rockets
+                alive[keep] = r
+                keep += 1
+        del alive[keep:]
+        while len(self.particles) < self.PARTICLES:
+            self._explode(self.rng.uniform(0, self.w), self.rng.uniform(0, self.h * 0.6))
+        if self.particles.vectorized:
+            self._move_particles_numpy()
+            return
         # move particles
-        new_particles = []
-        for p in self.particles:
-            p["x"] += p["vx"]
-            p["y"] += p["vy"]
-            p["vy"] += 0.08  # gravity
-            p["vx"] *= 0.98
-            p["life"] -= 1
-            if p["life"] > 0:
-                new_particles.append(p)
-        self.particles = new_particles
+        p = self.particles
+        xs, ys, vxs, vys, life = p.x, p.y, p.vx, p.vy, p.life
+        alive, free = p.alive, p.free
+        keep = 0
+        for i in alive:
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            vys[i] += 0.08  # gravity
+            vxs[i] *= 0.98
+            life[i] -= 1
+            if life[i] > 0:
+                alive[keep] = i
+                keep += 1
+            else:
+                free.append(i)
+        del alive[keep:]
+
+    def _move_particles_numpy(self):
+        # whole columns at once; free slots just drift along
+        p = self.particles
+        n = p.size
+        p.x[:n] += p.vx[:n]
+        p.y[:n] += p.vy[:n]
+        p.vy[:n] += 0.08  # gravity
+        p.vx[:n] *= 0.98
+        p.life[:n] -= 1
+        alive = np.array(p.alive, dtype=int)
+        live = p.life[alive] > 0
+        p.alive = alive[live].tolist()
+        p.free.extend(alive[~live].tolist())
 
     def draw(self, stdscr):
-        for r in self.rockets:
-            iy, ix = int(r["y"]), int(r["x"])
+        rockets = self.rockets
+        for r in rockets.alive:
+            iy, ix = int(rockets.y[r]), int(rockets.x[r])
             if 0 <= iy < self.h and 0 <= ix < self.w:
                 try:
-                    stdscr.addch(iy, ix, "|", curses.color_pair(7) | curses.A_BOLD)
+                    stdscr.addch(iy, ix, "|", self.rocket_attr)
                 except curses.error:
                     pass
-        for p in self.particles:
-            iy, ix = int(p["y"]), int(p["x"])
+        if self.particles.vectorized:
+            self._draw_particles_numpy(stdscr)
+            return
+        particles, looks = self.particles, self.looks
+        xs, ys, life, colors = particles.x, particles.y, particles.life, particles.color
+        for p in particles.alive:
+            iy, ix = int(ys[p]), int(xs[p])
             if 0 <= iy < self.h and 0 <= ix < self.w:
-                if self.has256:
-                    attr = curses.color_pair(100 + p["color"])
-                else:
-                    attr = curses.color_pair(1 + p["color"] % 7)
-                if p["life"] > 15:
-                    ch = "*"
-                    attr |= curses.A_BOLD
-                elif p["life"] > 8:
-                    ch = "+"
-                else:
-                    ch = "."
+                ch, attr = looks[colors[p]][life[p]]
                 try:
                     stdscr.addch(iy, ix, ch, attr)
                 except curses.error:
                     pass
 
+    def _draw_particles_numpy(self, stdscr):
+        p = self.particles
+        alive = np.array(p.alive, dtype=int)
+        iy = p.y[alive].astype(int)
+        ix = p.x[alive].astype(int)
+        life = p.life[alive]
+        colors = p.color[alive]
+        on = (iy >= 0) & (iy < self.h) & (ix >= 0) & (ix < self.w)
+        iy, ix, life, colors = iy[on], ix[on], life[on], colors[on]
+        # later particles cover earlier ones, so only the last per cell shows
+        cell = iy * self.w + ix
+        _, last = np.unique(cell[::-1], return_index=True)
+        last = len(cell) - 1 - last
+        iy, ix, life, colors = iy[last], ix[last], life[last], colors[last]
+        chars = self.np_look_chars[colors, life]
+        attrs = self.np_look_attrs[colors, life]
+        for y, x, ch, attr in zip(iy.tolist(), ix.tolist(), chars.tolist(), attrs.tolist()):
+            try:
+                stdscr.addch(y, x, ch, attr)
+            except curses.error:
+                pass
+
 
 # ---------------------------------------------------------------------------
 # Animation: Game of Life
 # ---------------------------------------------------------------------------
 
-class GameOfLife:
-    name = "Game of Life"
-
-    def __init__(self, h, w, has256):
-        self.h, self.w, self.has256 = h, w, has256
-        self.reset()
-
-    def reset(self):
-        self.grid = [[random.random() < 0.3 for _ in range(self.w)] for _ in range(self.h)]
-        self.age = [[0] * self.w for _ in range(self.h)]
+class LifeGrid:
+    """Reference engine: nested lists, 8 neighbour lookups per cell."""
 
-    def resize(self, h, w):
+    def __init__(self, h, w, grid):
         self.h, self.w = h, w
-        self.reset()
+        self.grid = grid
+        self.age = [[0] * w for _ in range(h)]
 
-    def update(self):
+    def step(self):
         new = [[False] * self.w for _ in range(self.h)]
         for y in range(self.h):
             for x in range(self.w):
@@ -283,20 +771,473 @@ class GameOfLife:
                     self.age[y][x] = 0
         self.grid = new
 
+    def population(self):
+        return sum(map(sum, self.grid))
+
+    def live_cells(self):
+        """Yield (y, x, age) for every live cell."""
+        for y, row in enumerate(self.grid):
+            ages = self.age[y]
+            for x, alive in enumerate(row):
+                if alive:
+                    yield y, x, ages[x]
+
+
+class LifeBitset:
+    """Bit-parallel engine: each row is a Python int with bit x = column x.
+
+    A generation is a handful of whole-row bitwise operations: every row's
+    horizontal 3-cell sum is kept as two bit planes (ones, twos), and the
+    three sums around a row are added with bit-sliced full adders. Using the
+    9-cell total (neighbours + self), a cell lives next generation when the
+    total is 3, or when it is 4 and the cell is alive. Ages are stored only
+    for live cells, as their birth generation.
+    """
+
+    def __init__(self, h, w, grid):
+        self.h, self.w = h, w
+        self.mask = (1 << w) - 1
+        self.rows = [sum(1 << x for x, alive in enumerate(row) if alive) for row in grid]
+        self.gen = 0
+        self.birth = {}
+        for y, r in enumerate(self.rows):
+            for x in self._bits(r):
+                self.birth[y * w + x] = 0
+
+    @staticmethod
+    def _bits(v):
+        while v:
+            low = v & -v
+            yield low.bit_length() - 1
+            v ^= low
+
+    def step(self):
+        h, w, mask = self.h, self.w, self.mask
+        if not w or not h:
+            return
+        top = w - 1
+        rows = self.rows
+        ones, twos = [], []
+        for r in rows:
+            west = ((r << 1) | (r >> top)) & mask  # bit x holds cell x-1
+            east = (r >> 1) | ((r & 1) << top)     # bit x holds cell x+1
+            s = west ^ east
+            ones.append(s ^ r)
+            twos.append((west & east) | (s & r))
+        new_rows = []
+        for y in range(h):
+            below = (y + 1) % h
+            o1, o2, o3 = ones[y - 1], ones[y], ones[below]
+            t1, t2, t3 = twos[y - 1], twos[y], twos[below]
+            # ones column: parity bit and a carry into the twos column
+            s = o1 ^ o2
+            one = s ^ o3
+            carry = (o1 & o2) | (s & o3)
+            # twos column: t1 + t2 + t3 + carry, only 1 and 2 matter
+            s = t1 ^ t2
+            lo = s ^ t3
+            hi = (t1 & t2) | (s & t3)
+            low = lo ^ carry
+            twos_is_1 = low & ~hi
+            twos_is_2 = (hi ^ (lo & carry)) & ~low
+            new_rows.append((one & twos_is_1) | (rows[y] & twos_is_2 & ~one))
+        self.gen += 1
+        gen, birth = self.gen, self.birth
+        for y, (old, new) in enumerate(zip(rows, new_rows)):
+            changed = old ^ new
+            if not changed:
+                continue
+            base = y * w
+            born = changed & new
+            for x in self._bits(changed):
+                if born >> x & 1:
+                    birth[base + x] = gen - 1
+                else:
+                    del birth[base + x]
+        self.rows = new_rows
+
+    def population(self):
+        return len(self.birth)
+
+    def live_cells(self):
+        """Yield (y, x, age) for every live cell."""
+        gen, birth, w = self.gen, self.birth, self.w
+        for y, r in enumerate(self.rows):
+            base = y * w
+            for x in self._bits(r):
+                yield y, x, gen - birth[base + x]
+
+
+class LifeSparse:
+    """Active-set engine: only cells whose neighbourhood changed last
+    generation are re-evaluated.
+
+    Neighbour counts are kept in a bytearray and adjusted as cells are born
+    or die, so evaluating a candidate is two lookups. Changed cells are
+    collected in `dirty` until the exhibit draws them. Ages saturate at
+    AGE_CAP, after which a still cell never needs redrawing again.
+    """
+    AGE_CAP = 29
+
+    def __init__(self, h, w, grid):
+        self.h, self.w = h, w
+        self.cells = bytearray(1 if alive else 0 for row in grid for alive in row)
+        self.nbrs = []
+        for y in range(h):
+            up, mid, down = ((y - 1) % h) * w, y * w, ((y + 1) % h) * w
+            for x in range(w):
+                left, right = (x - 1) % w, (x + 1) % w
+                self.nbrs.append((up + left, up + x, up + right, mid + left,
+                                  mid + right, down + left, down + x, down + right))
+        self.counts = bytearray(h * w)
+        for i, alive in enumerate(self.cells):
+            if alive:
+                for j in self.nbrs[i]:
+                    self.counts[j] += 1
+        self.birth = [0] * (h * w)
+        self.gen = 0
+        self.active = set(range(h * w))
+        self.young = {i for i, alive in enumerate(self.cells) if alive}
+        self.dirty = set()
+
+    def step(self):
+        cells, counts, nbrs = self.cells, self.counts, self.nbrs
+        born, died = [], []
+        for i in self.active:
+            n = counts[i]
+            if cells[i]:
+                if n != 2 and n != 3:
+                    died.append(i)
+            elif n == 3:
+                born.append(i)
+        self.gen += 1
+        gen, birth = self.gen, self.birth
+        active = set(born)
+        active.update(died)
+        for i in born:
+            cells[i] = 1
+            birth[i] = gen - 1
+            for j in nbrs[i]:
+                counts[j] += 1
+            active.update(nbrs[i])
+        for i in died:
+            cells[i] = 0
+            for j in nbrs[i]:
+                counts[j] -= 1
+            active.update(nbrs[i])
+        self.active = active
+        young = self.young
+        young.difference_update(died)
+        # surviving young cells aged by one and changed colour
+        self.dirty.update(young, born, died)
+        cap = self.AGE_CAP
+        self.young = {i for i in young if gen - birth[i] < cap}
+        self.young.update(born)
+
+    def _cell(self, i):
+        y, x = divmod(i, self.w)
+        return y, x, (min(self.gen - self.birth[i], self.AGE_CAP) if self.cells[i] else None)
+
+    def population(self):
+        return self.cells.count(1)
+
+    def live_cells(self):
+        """Yield (y, x, age) for every live cell."""
+        for i, alive in enumerate(self.cells):
+            if alive:
+                yield self._cell(i)
+
+    def all_cells(self):
+        """Yield (y, x, age) for every cell, age None when dead."""
+        self.dirty.clear()
+        for i in range(self.h * self.w):
+            yield self._cell(i)
+
+    def dirty_cells(self):
+        """Yield (y, x, age) for cells changed since the last call."""
+        dirty, self.dirty = self.dirty, set()
+        for i in dirty:
+            yield self._cell(i)
+
+
+class LifeWorld:
+    """Bit-parallel engine for worlds much larger than the screen.
+
+    The whole torus is a single Python int, row y in bits y*w .. y*w+w-1, so
+    a generation runs LifeBitset's adders once over the world instead of
+    once per row, with the horizontal wrap done by masking every row's edge
+    bits. Ages are AGE_BITS bit planes holding a saturating counter that is
+    advanced with the same whole-world operations, so a 4096x4096 world
+    takes 2 MB per plane. Only the part on screen is ever unpacked.
+    """
+    AGE_BITS = 5  # ages saturate at 31
+
+    def __init__(self, h, w, rng):
+        self.h, self.w = h, w
+        n = h * w
+        self.all = (1 << n) - 1
+        self.col0 = self.all // ((1 << w) - 1)  # bit 0 of every row
+        self.colw = self.col0 << (w - 1)        # bit w-1 of every row
+        self.not0, self.notw = self.all ^ self.col0, self.all ^ self.colw
+        a, b, c, d = (rng.getrandbits(n) for _ in range(4))
+        self.cells = a & (b | (c & d))  # 31% alive
+        self.ages = [0] * self.AGE_BITS
+        self.gen = 0
+        self._population = None  # cached for the current generation
+
+    def step(self):
+        h, w, cells = self.h, self.w, self.cells
+        if not w or not h:
+            return
+        # Big-int ~x is -(x + 1) and costs extra passes, so x & ~y is written
+        # x ^ (x & y) throughout.
+        west = ((cells << 1) & self.not0) | ((cells >> (w - 1)) & self.col0)
+        east = ((cells >> 1) & self.notw) | ((cells & self.col0) << (w - 1))
+        s = west ^ east
+        ones = s ^ cells
+        twos = (west & east) | (s & cells)
+        # the rows above and below, rotated around the torus; the row pushed
+        # past the top bit is cleared once at the end
+        shift, last = (h - 1) * w, (1 << w) - 1
+        o1 = (ones << w) | (ones >> shift)
+        o3 = (ones >> w) | ((ones & last) << shift)
+        t1 = (twos << w) | (twos >> shift)
+        t3 = (twos >> w) | ((twos & last) << shift)
+        s = o1 ^ ones
+        one = s ^ o3
+        carry = (o1 & ones) | (s & o3)
+        s = t1 ^ twos
+        lo = s ^ t3
+        hi = (t1 & twos) | (s & t3)
+        low = lo ^ carry
+        twos_is_1 = low ^ (low & hi)
+        twos_is_2 = hi ^ (lo & carry)
+        twos_is_2 ^= twos_is_2 & low
+        keep = cells & twos_is_2
+        new = ((one & twos_is_1) | (keep ^ (keep & one))) & self.all
+        # survivors age by one up to the cap, the dead go back to 0
+        survivors = cells & new
+        saturated = self.ages[0]
+        for plane in self.ages[1:]:
+            saturated &= plane
+        carry = survivors ^ (survivors & saturated)
+        ages = []
+        for plane in self.ages:
+            plane &= new
+            ages.append(plane ^ carry)
+            carry &= plane
+        ages[0] |= new ^ survivors  # newborns are 1
+        self.ages = ages
+        self.cells = new
+        self.gen += 1
+        self._population = None
+
+    def population(self):
+        if self._population is None:
+            self._population = bin(self.cells).count("1")
+        return self._population
+
+    def _unpack(self, plane, top, rows):
+        """Bytes holding rows top .. top+rows-1 of a bit plane."""
+        n = rows * self.w
+        return ((plane >> (top * self.w)) & ((1 << n) - 1)).to_bytes((n + 7) // 8, "little")
+
+    @staticmethod
+    def _bits(data, start, n):
+        """n bits of unpacked rows from bit `start`, as an int."""
+        chunk = int.from_bytes(data[start >> 3:(start + n + 7) >> 3], "little")
+        return (chunk >> (start & 7)) & ((1 << n) - 1)
+
+    def live_cells(self, top, left, h, w):
+        """Yield (y, x, age) for every live cell of a window, relative to it."""
+        cells = self._unpack(self.cells, top, h)
+        ages = [self._unpack(plane, top, h) for plane in self.ages]
+        for y in range(h):
+            start = y * self.w + left
+            row = self._bits(cells, start, w)
+            if not row:
+                continue
+            planes = [self._bits(plane, start, w) for plane in ages]
+            for x in LifeBitset._bits(row):
+                yield y, x, sum((plane >> x & 1) << k for k, plane in enumerate(planes))
+
+    def density(self, top, left, h, w, zoom):
+        """Live-cell counts of the zoom x zoom blocks of a window, as h rows
+        of w counts each; zoom is a power of two.
+
+        Each world row is popcounted in zoom-bit lanes with SWAR shifts and
+        masks, and the rows of a block are added lane-wise. Lanes narrower
+        than a byte are split into one byte-lane sum per phase first, so that
+        a block's total cannot carry into its neighbour.
+        """
+        cells = self._unpack(self.cells, top, h * zoom)
+        n = w * zoom
+
+        def repeat(pattern, period):
+            return pattern * ((1 << (n + period - 1) // period * period) - 1) // ((1 << period) - 1)
+
+        steps = []
+        lane = 1
+        while lane < zoom:
+            steps.append((lane, repeat((1 << lane) - 1, 2 * lane)))
+            lane *= 2
+        phases = max(1, 8 // zoom)
+        byte_lanes = repeat((1 << zoom) - 1, 8) if phases > 1 else None
+        typecode = next(t for t in "BHILQ" if array(t).itemsize == max(1, zoom // 8))
+        rows = []
+        for y in range(h):
+            sums = [0] * phases
+            for start in range(y * zoom * self.w + left, (y + 1) * zoom * self.w, self.w):
+                v = self._bits(cells, start, n)
+                for shift, mask in steps:
+                    v = (v & mask) + ((v >> shift) & mask)
+                if byte_lanes is None:
+                    sums[0] += v
+                else:
+                    for k in range(phases):
+                        sums[k] += (v >> (k * zoom)) & byte_lanes
+            if byte_lanes is None:
+                counts = array(typecode, sums[0].to_bytes(w * zoom // 8, "little"))
+                if sys.byteorder == "big":
+                    counts.byteswap()
+            else:
+                counts = bytearray(w)
+                for k, v in enumerate(sums):
+                    part = v.to_bytes((n + 7) // 8, "little")
+                    counts[k::phases] = part[:len(range(k, w, phases))]
+            rows.append(counts)
+        return rows
+
+
+class GameOfLife:
+    """Conway's Life on a torus the size of the screen, or on a larger
+    WORLD that the screen is a camera onto.
+
+    The camera pans and zooms out in powers of two; zoomed out, each screen
+    cell shows how crowded its block of the world is with a density glyph.
+    Only the cells in view are unpacked and drawn, and resizing the
+    terminal moves the camera instead of starting a new world.
+    """
+    name = "Game of Life"
+    PALETTES = ("rainbow",)
+    ENGINES = {"bitset": LifeBitset, "grid": LifeGrid, "sparse": LifeSparse}
+    ENGINE = "bitset"
+    WORLD = None  # world size in cells as (rows, cols); None fits the screen
+    ZOOMS = (1, 2, 4, 8, 16, 32)  # world cells per screen cell, each way
+    AGE_COLORS = 30  # rainbow shades by age; older cells keep the last
+    DENSITY = "\u2591\u2592\u2593\u2588"
+    # Block density is quantized to LEVELS steps; 1024 is a multiple of
+    # every block area, so each count gets a level of its own.
+    LEVELS = 1024
+
+    def __init__(self, h, w, has256):
+        self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        self.shades = palette(has256)[GameOfLife]
+        self.looks = {}  # zoom -> (char, attr) by live cells per block
+        # (char, attr) by age: capped at AGE_COLORS - 1, or cycling in basic mode
+        if has256:
+            self.ages = [("\u2588", color_pair(50 + a)) for a in range(self.AGE_COLORS)]
+        else:
+            self.ages = [("\u2588", color_pair(1 + a)) for a in range(7)]
+        self.reset()
+
+    @classmethod
+    def shade(cls, v, has256):
+        ch = cls.DENSITY[min(int(v * len(cls.DENSITY)), len(cls.DENSITY) - 1)]
+        if has256:
+            return ch, color_pair(50 + int(v * 29))
+        return ch, color_pair(2) | (curses.A_BOLD if v > 0.5 else 0)
+
+    def reset(self):
+        if self.WORLD:
+            self.engine = LifeWorld(*self.WORLD, self.rng)
+            self.zoom = 0  # index into ZOOMS
+            self.cy, self.cx = self.WORLD[0] // 2, self.WORLD[1] // 2  # camera centre
+            self.incremental = False
+            return
+        grid = [[self.rng.random() < 0.3 for _ in range(self.w)] for _ in range(self.h)]
+        self.engine = self.ENGINES[self.ENGINE](self.h, self.w, grid)
+        # sparse engine draws only changed cells on top of the last frame
+        self.incremental = hasattr(self.engine, "dirty_cells")
+        self.stale = True
+
+    def invalidate(self):
+        """The screen was cleared; redraw everything on the next draw()."""
+        self.stale = True
+
+    def resize(self, h, w):
+        self.h, self.w = h, w
+        if not self.WORLD:
+            self.reset()
+
+    def camera(self, dy, dx, dzoom):
+        """Pan by quarter screens and zoom in (-1) or out (+1) a step."""
+        if not self.WORLD:
+            return
+        self.zoom = clamp(self.zoom + dzoom, 0, len(self.ZOOMS) - 1)
+        z = self.ZOOMS[self.zoom]
+        self.cy = clamp(self.cy + dy * max(1, self.h * z // 4), 0, self.WORLD[0] - 1)
+        self.cx = clamp(self.cx + dx * max(1, self.w * z // 4), 0, self.WORLD[1] - 1)
+
+    def view(self):
+        """The zoom, and the world (top, left, rows, cols) on screen in
+        screen cells, with the camera kept inside the world."""
+        z = self.ZOOMS[self.zoom]
+        rows, cols = min(self.h, self.WORLD[0] // z), min(self.w, self.WORLD[1] // z)
+        top = clamp(self.cy - rows * z // 2, 0, self.WORLD[0] - rows * z)
+        left = clamp(self.cx - cols * z // 2, 0, self.WORLD[1] - cols * z)
+        return z, top, left, rows, cols
+
+    def counts(self):
+        return {"live cells": self.engine.population()}
+
+    def update(self):
+        self.engine.step()
+
+    def status(self):
+        if self.WORLD:
+            z, top, left, _, _ = self.view()
+            rows, cols = self.WORLD
+            return f"{cols}x{rows} world, 1:{z} at {left},{top}  wasd:pan +/-:zoom"
+        if self.incremental:
+            return f"{len(self.engine.active)}/{self.h * self.w} active"
+        return ""
+
     def draw(self, stdscr):
-        for y in range(self.h):
-            for x in range(self.w):
-                if self.grid[y][x]:
-                    a = self.age[y][x]
-                    if self.has256:
-                        idx = clamp(a, 0, 29)
-                        attr = curses.color_pair(50 + idx)
-                    else:
-                        attr = curses.color_pair(1 + (a % 7))
-                    try:
-                        stdscr.addch(y, x, "\u2588", attr)
-                    except curses.error:
-                        pass
+        if self.WORLD:
+            z, top, left, rows, cols = self.view()
+            if z > 1:
+                self._draw_density(stdscr, z, top, left, rows, cols)
+                return
+            cells = self.engine.live_cells(top, left, rows, cols)
+        elif not self.incremental:
+            cells = self.engine.live_cells()
+        elif self.stale:
+            cells = self.engine.all_cells()
+            self.stale = False
+        else:
+            cells = self.engine.dirty_cells()
+        ages, cycle, last = self.ages, not self.has256, len(self.ages) - 1
+        for y, x, a in cells:
+            if a is None:
+                ch, attr = " ", 0
+            elif cycle:
+                ch, attr = ages[a % 7]
+            else:
+                ch, attr = ages[a if a < last else last]
+            try:
+                stdscr.addch(y, x, ch, attr)
+            except curses.error:
+                pass
+
+    def _draw_density(self, stdscr, z, top, left, rows, cols):
+        looks = self.looks.get(z)
+        if looks is None:
+            scale = self.LEVELS // (z * z)
+            looks = self.looks[z] = [(" ", 0)] + [self.shades[2 * n * scale] for n in range(1, z * z + 1)]
+        for y, counts in enumerate(self.engine.density(top, left, rows, cols, z)):
+            stdscr.blit(y, 0, [looks[n][0] for n in counts], [looks[n][1] for n in counts])
 
 
 # ---------------------------------------------------------------------------
@@ -305,38 +1246,76 @@ class GameOfLife:
 
 class PlasmaWaves:
     name = "Plasma Waves"
+    PALETTES = ("rainbow",)
     GRADIENT = " .:-=+*#%@"
+    # The field sums four sines, v in [-4, 4], normalised to nv in [0, 1].
+    # nv is quantized to LEVELS steps; 522 is a multiple of 9, 29 and 6, so
+    # every step falls entirely inside one glyph/colour band.
+    LEVELS = 522
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.shades = palette(has256)[PlasmaWaves]
+        if np is not None:
+            self.np_shade_chars = np.array([ch for ch, _ in self.shades])
+            self.np_shade_attrs = np.array([attr for _, attr in self.shades])
         self.t = 0.0
+        self._build_tables()
 
     def reset(self):
         self.t = 0.0
 
     def resize(self, h, w):
         self.h, self.w = h, w
+        self._build_tables()
+
+    def _build_tables(self):
+        scale = self.LEVELS / 8.0
+        # sin(r*0.04 + a) = sin(r*0.04)*cos(a) + cos(r*0.04)*sin(a), with the
+        # distance r = sqrt(x^2 + y^2) fixed for a given screen size
+        self.radial_sin, self.radial_cos = [], []
+        for y in range(self.h):
+            r = [math.sqrt(x * x + y * y) * 0.04 for x in range(self.w)]
+            self.radial_sin.append([math.sin(v) * scale for v in r])
+            self.radial_cos.append([math.cos(v) * scale for v in r])
+        if np is not None:
+            self.np_radial_sin = np.array(self.radial_sin, dtype=float).reshape(self.h, self.w)
+            self.np_radial_cos = np.array(self.radial_cos, dtype=float).reshape(self.h, self.w)
+            self.np_diag_index = np.arange(self.h)[:, None] + np.arange(self.w)[None, :]
+
+    @classmethod
+    def shade(cls, v, has256):
+        n = len(cls.GRADIENT)
+        ch = cls.GRADIENT[min(int(v * (n - 1)), n - 1)]
+        if has256:
+            return ch, color_pair(50 + int(v * 29))
+        return ch, color_pair(1 + int(v * 6))
 
     def update(self):
         self.t += 0.07
 
     def draw(self, stdscr):
-        t = self.t
+        t, w = self.t, self.w
+        scale = self.LEVELS / 8.0
+        # the x, y and x+y terms are separable into per-axis vectors
+        cols = [math.sin(x * 0.06 + t) * scale for x in range(w)]
+        rows = [math.sin(y * 0.08 + t * 0.7) * scale + self.LEVELS / 2.0
+                for y in range(self.h)]
+        diag = [math.sin(i * 0.04 + t * 0.5) * scale for i in range(w + self.h)]
+        ca, sa = math.cos(t * 0.8), math.sin(t * 0.8)
+        if np is not None:
+            levels = shade_level(np.array(rows)[:, None] + np.array(cols)[None, :]
+                                 + np.array(diag)[self.np_diag_index]
+                                 + self.np_radial_sin * ca + self.np_radial_cos * sa)
+            blit_arrays(stdscr, self.np_shade_chars[levels], self.np_shade_attrs[levels])
+            return
+        shades = self.shades
         for y in range(self.h):
-            for x in range(self.w):
-                v = math.sin(x * 0.06 + t)
-                v += math.sin(y * 0.08 + t * 0.7)
-                v += math.sin((x + y) * 0.04 + t * 0.5)
-                v += math.sin(math.sqrt(x * x + y * y) * 0.04 + t * 0.8)
-                # v is roughly in [-4, 4], normalize to [0, 1]
-                nv = (v + 4) / 8.0
-                ci = int(nv * (len(self.GRADIENT) - 1))
-                ch = self.GRADIENT[clamp(ci, 0, len(self.GRADIENT) - 1)]
-                if self.has256:
-                    pair = 50 + int(nv * 29)
-                    attr = curses.color_pair(clamp(pair, 50, 79))
-                else:
-                    attr = curses.color_pair(1 + int(nv * 6))
+            base = rows[y]
+            levels = [shade_level(base + c + d + rs * ca + rc * sa) for c, d, rs, rc
+                      in zip(cols, diag[y:y + w], self.radial_sin[y], self.radial_cos[y])]
+            for x, level in enumerate(levels):
+                ch, attr = shades[level]
                 try:
                     stdscr.addch(y, x, ch, attr)
                 except curses.error:
@@ -348,10 +1327,32 @@ class PlasmaWaves:
 # ---------------------------------------------------------------------------
 
 class MazeGenerator:
+    """Carves a maze with recursive backtracking, or with Eller's algorithm.
+
+    The backtracker keeps the whole maze in a flat bytearray, one byte per
+    cell with the wall and visited flags packed in, and only redraws the
+    cells each step carved. Eller's algorithm builds the maze a row at a
+    time from the set each cell of the previous row belongs to, so it only
+    ever holds O(width) state plus the rows on screen, and can produce mazes
+    far larger than memory would allow the backtracker.
+
+    A maze larger than the screen (SIZE) is shown through a viewport: it
+    follows the backtracker's head, or scrolls down with Eller's newest rows
+    while panning across.
+    """
     name = "Maze Generator"
+    PALETTES = ("rainbow",)
+    MODE = "backtrack"  # "backtrack" or "eller"
+    SIZE = None  # maze size in cells as (rows, cols); None fits the screen
+    WALL, VISITED = 1, 2  # cell flags
+    JOIN = 0.5  # Eller: chance of joining neighbouring sets / carving down
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        wall = color_pair(50 + 15) if has256 else color_pair(4)  # wall color
+        self.looks = [(" ", 0), ("\u2588", wall), (" ", 0)]  # by cell byte
+        self.incremental = self.MODE == "backtrack"
         self.reset()
 
     def resize(self, h, w):
@@ -359,28 +1360,36 @@ class MazeGenerator:
         self.reset()
 
     def reset(self):
+        rows, cols = self.SIZE or ((self.h - 1) // 2, (self.w - 1) // 2)
         # maze dimensions (odd numbers for walls+cells)
-        self.mh = (self.h // 2) * 2 + 1
-        self.mw = (self.w // 2) * 2 + 1
-        self.grid = [[1] * self.mw for _ in range(self.mh)]  # 1=wall
-        self.stack = []
-        self.visited = set()
+        self.mh, self.mw = rows * 2 + 1, cols * 2 + 1
+        self.oy = self.ox = 0  # viewport origin
         self.done = False
         self.done_tick = 0
+        self.stale = True
+        if self.MODE == "eller":
+            self._reset_eller(rows, cols)
+            return
+        mw = self.mw
+        self.grid = bytearray([self.WALL]) * (self.mh * mw)
+        self.stack = []
+        self.changed = []  # cells to redraw
         # start at (1,1)
-        sy, sx = 1, 1
-        if sy < self.mh and sx < self.mw:
-            self.grid[sy][sx] = 0
-            self.visited.add((sy, sx))
-            self.stack.append((sy, sx))
-
-    def _neighbors(self, y, x):
-        dirs = [(y - 2, x), (y + 2, x), (y, x - 2), (y, x + 2)]
-        result = []
-        for ny, nx in dirs:
-            if 1 <= ny < self.mh - 1 and 1 <= nx < self.mw - 1 and (ny, nx) not in self.visited:
-                result.append((ny, nx))
-        return result
+        if self.mh > 2 and mw > 2:
+            self.grid[mw + 1] = self.VISITED
+            self.stack.append(mw + 1)
+        # the four cells two steps away, and the wall in between
+        self.moves = ((-2 * mw, -mw), (2 * mw, mw), (-2, -1), (2, 1))
+        self.nbrs = []
+
+    def invalidate(self):
+        """The screen was cleared; redraw everything on the next draw()."""
+        self.stale = True
+
+    def counts(self):
+        if self.MODE == "eller":
+            return {"rows": self.row}
+        return {"stack": len(self.stack)}
 
     def update(self):
         if self.done:
@@ -388,44 +1397,154 @@ class MazeGenerator:
             if self.done_tick > 80:
                 self.reset()
             return
-        steps = max(1, (self.mh * self.mw) // 200)  # carve multiple cells per frame
+        if self.MODE == "eller":
+            self._update_eller()
+            return
+        # carve multiple cells per frame
+        steps = max(1, (min(self.mh, self.h) * min(self.mw, self.w)) // 200)
+        grid, stack, changed, nbrs = self.grid, self.stack, self.changed, self.nbrs
+        mw, top, bottom = self.mw, self.mw, (self.mh - 1) * self.mw
+        visited = self.VISITED
+        if stack:
+            changed.append(stack[-1])  # the old head
         for _ in range(steps):
-            if not self.stack:
+            if not stack:
                 self.done = True
-                return
-            cy, cx = self.stack[-1]
-            nbrs = self._neighbors(cy, cx)
+                break
+            i = stack[-1]
+            x = i % mw
+            nbrs.clear()
+            for step, wall in self.moves:
+                j = i + step
+                if (top <= j < bottom and (step != -2 or x > 1) and (step != 2 or x < mw - 2)
+                        and not grid[j] & visited):
+                    nbrs.append((j, i + wall))
             if nbrs:
-                ny, nx = random.choice(nbrs)
+                j, wall = self.rng.choice(nbrs)
                 # carve wall between
-                wy, wx = (cy + ny) // 2, (cx + nx) // 2
-                self.grid[wy][wx] = 0
-                self.grid[ny][nx] = 0
-                self.visited.add((ny, nx))
-                self.stack.append((ny, nx))
+                grid[wall] = 0
+                grid[j] = visited
+                stack.append(j)
+                changed += (wall, j)
             else:
-                self.stack.pop()
+                stack.pop()
+        if stack:
+            changed.append(stack[-1])
+            self._follow(stack[-1] // mw, stack[-1] % mw)
+
+    def _follow(self, y, x):
+        """Move the viewport just enough to keep (y, x) away from its edges."""
+        oy = self._scroll(self.oy, y, self.h, self.mh)
+        ox = self._scroll(self.ox, x, self.w, self.mw)
+        if (oy, ox) != (self.oy, self.ox):
+            self.oy, self.ox = oy, ox
+            self.stale = True
+
+    @staticmethod
+    def _scroll(origin, pos, span, size):
+        margin = span // 4
+        if pos < origin + margin:
+            origin = pos - margin
+        elif pos >= origin + span - margin:
+            origin = pos - span + margin + 1
+        return max(0, min(origin, size - span))
 
     def draw(self, stdscr):
-        for y in range(min(self.mh, self.h)):
-            for x in range(min(self.mw, self.w)):
-                if self.grid[y][x] == 1:
-                    if self.has256:
-                        attr = curses.color_pair(50 + 15)  # wall color
-                    else:
-                        attr = curses.color_pair(4)
+        if self.MODE == "eller":
+            self._draw_eller(stdscr)
+            return
+        h, w = min(self.mh, self.h), min(self.mw, self.w)
+        grid, mw, looks, oy, ox = self.grid, self.mw, self.looks, self.oy, self.ox
+        if self.stale:
+            self.stale = False
+            self.changed.clear()
+            for y in range(h):
+                row = grid[(oy + y) * mw + ox:(oy + y) * mw + ox + w]
+                stdscr.blit(y, 0, [looks[v][0] for v in row], [looks[v][1] for v in row])
+        else:
+            for i in self.changed:
+                y, x = divmod(i, mw)
+                y, x = y - oy, x - ox
+                if 0 <= y < h and 0 <= x < w:
+                    ch, attr = looks[grid[i]]
                     try:
-                        stdscr.addch(y, x, "\u2588", attr)
+                        stdscr.addch(y, x, ch, attr)
                     except curses.error:
                         pass
-                else:
-                    # passage — show head of stack brighter
-                    if self.stack and (y, x) == self.stack[-1]:
-                        attr = curses.color_pair(7) | curses.A_BOLD
-                        try:
-                            stdscr.addch(y, x, "\u00b7", attr)
-                        except curses.error:
-                            pass
+            self.changed.clear()
+        # passage — show head of stack brighter
+        if self.stack:
+            y, x = divmod(self.stack[-1], mw)
+            if 0 <= y - oy < h and 0 <= x - ox < w:
+                try:
+                    stdscr.addch(y - oy, x - ox, "\u00b7", color_pair(7) | curses.A_BOLD)
+                except curses.error:
+                    pass
+
+    # -- Eller's algorithm --------------------------------------------------
+
+    def _reset_eller(self, rows, cols):
+        self.rows, self.cols = rows, cols
+        self.row = 0  # cell rows generated
+        self.sets = list(range(cols))  # set of each cell in the current row
+        self.members = {c: [c] for c in range(cols)}
+        self.next_set = cols
+        self.lines = deque(maxlen=self.h)  # display rows on screen, newest last
+        self.pending = deque([bytearray([self.WALL]) * self.mw])  # top border
+        self.pan = 1
+
+    def _update_eller(self):
+        if not self.pending:
+            if self.row == self.rows:
+                self.done = True
+                return
+            self._eller_row()
+        self.lines.append(self.pending.popleft())
+        # pan back and forth across a maze wider than the screen
+        if self.mw > self.w:
+            if not 0 <= self.ox + self.pan <= self.mw - self.w:
+                self.pan = -self.pan
+            self.ox += self.pan
+
+    def _eller_row(self):
+        """Generate the next cell row and the wall row below it."""
+        cols, sets, members, rng = self.cols, self.sets, self.members, self.rng
+        last = self.row == self.rows - 1
+        line = bytearray([self.WALL]) * self.mw
+        line[1:-1:2] = bytes(cols)
+        for c in range(cols - 1):
+            a, b = sets[c], sets[c + 1]
+            if a != b and (last or rng.random() < self.JOIN):
+                line[2 * c + 2] = 0
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for m in members[b]:
+                    sets[m] = a
+                members[a] += members.pop(b)
+        below = bytearray([self.WALL]) * self.mw
+        if not last:
+            # every set carries on down through at least one of its cells
+            new_sets, new_members = [None] * cols, {}
+            for s, cells in members.items():
+                down = [c for c in cells if rng.random() < self.JOIN] or [rng.choice(cells)]
+                for c in down:
+                    below[2 * c + 1] = 0
+                    new_sets[c] = s
+                new_members[s] = down
+            for c in range(cols):
+                if new_sets[c] is None:
+                    new_sets[c] = self.next_set
+                    new_members[self.next_set] = [c]
+                    self.next_set += 1
+            self.sets, self.members = new_sets, new_members
+        self.row += 1
+        self.pending += (line, below)
+
+    def _draw_eller(self, stdscr):
+        looks, ox, w = self.looks, self.ox, min(self.mw, self.w)
+        for y, line in enumerate(self.lines):
+            row = line[ox:ox + w]
+            stdscr.blit(y, 0, [looks[v][0] for v in row], [looks[v][1] for v in row])
 
 
 # ---------------------------------------------------------------------------
@@ -434,9 +1553,14 @@ class MazeGenerator:
 
 class Spirograph:
     name = "Spirograph"
+    PALETTES = ("rainbow",)
+    POINTS = 3  # points plotted per curve per frame
+    TRAIL = 80  # frames a point stays on screen
+    SET_TICKS = 400  # frames before a new set of curves
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
         self.reset()
 
     def reset(self):
@@ -445,64 +1569,81 @@ class Spirograph:
         self._new_curve_set()
 
     def _new_curve_set(self):
+        """Pick three hypotrochoids and precompute every point they will plot.
+
+        R, r and d stay fixed until the next set, so the screen position of
+        each point is known up front. The trail is then just the last
+        POINTS * TRAIL of them, and a point's age follows from how far it
+        is behind `plotted`.
+        """
         self.curves = []
+        self.plotted = 0
         offsets = [0, 10, 20]
-        random.shuffle(offsets)
+        self.rng.shuffle(offsets)
+        cx, cy = self.w / 2, self.h / 2
+        scale = min(self.h, self.w) * 0.35
         for i in range(3):
-            R = random.uniform(8, 16)
-            r = random.uniform(2, 7)
-            d = random.uniform(3, 10)
+            R = self.rng.uniform(8, 16)
+            r = self.rng.uniform(2, 7)
+            d = self.rng.uniform(3, 10)
+            t = self.rng.uniform(0, math.pi)
+            k = (R - r) / r
+            # normalize to [-1,1] range then scale
+            norm = R + d
+            points = []
+            for _ in range(self.POINTS * (self.SET_TICKS + 1)):
+                x = (R - r) * math.cos(t) + d * math.cos(k * t)
+                y = (R - r) * math.sin(t) - d * math.sin(k * t)
+                points.append((int(cx + x / norm * scale),
+                               int(cy + y / norm * scale * 0.5)))  # aspect correction
+                t += 0.05
             self.curves.append({
-                "R": R, "r": r, "d": d, "t": random.uniform(0, math.pi),
-                "color_base": offsets[i], "trail": []
+                "points": points, "looks": self._looks(offsets[i]),
             })
 
+    def _looks(self, base):
+        """(char, attr) for each trail age, 1 being the newest points."""
+        looks = [None]
+        for age in range(1, self.TRAIL + 1):
+            if age < 5:
+                ch, bold = "@", True
+            elif age < 20:
+                ch, bold = "*", True
+            elif age < 40:
+                ch, bold = "+", False
+            else:
+                ch, bold = ".", False
+            if self.has256:
+                ci = 50 + (base + min(age // 3, 9)) % 30
+                attr = color_pair(ci)
+            else:
+                attr = color_pair(1 + base % 7)
+            if bold:
+                attr |= curses.A_BOLD
+            looks.append((ch, attr))
+        return looks
+
     def resize(self, h, w):
         self.h, self.w = h, w
         self.reset()
 
     def update(self):
         self.tick += 1
-        cx, cy = self.w / 2, self.h / 2
-        scale = min(self.h, self.w) * 0.35
-        for c in self.curves:
-            for _ in range(3):  # plot multiple points per frame
-                t = c["t"]
-                R, r, d = c["R"], c["r"], c["d"]
-                x = (R - r) * math.cos(t) + d * math.cos((R - r) / r * t)
-                y = (R - r) * math.sin(t) - d * math.sin((R - r) / r * t)
-                # normalize to [-1,1] range then scale
-                norm = R + d
-                sx = int(cx + x / norm * scale)
-                sy = int(cy + y / norm * scale * 0.5)  # aspect correction
-                c["trail"].append((sx, sy, 0))
-                c["t"] += 0.05
-            # age trail
-            c["trail"] = [(x, y, a + 1) for x, y, a in c["trail"] if a < 80]
-        if self.tick > 400:
+        self.plotted += self.POINTS
+        if self.tick > self.SET_TICKS:
             self.tick = 0
             self._new_curve_set()
 
     def draw(self, stdscr):
+        end, rate = self.plotted, self.POINTS
+        start = max(0, end - rate * self.TRAIL)
         for c in self.curves:
-            base = c["color_base"]
-            for x, y, age in c["trail"]:
+            points, looks = c["points"], c["looks"]
+            # oldest first, so newer points cover older ones
+            for i in range(start, end):
+                x, y = points[i]
                 if 0 <= y < self.h and 0 <= x < self.w:
-                    if age < 5:
-                        ch, bold = "@", True
-                    elif age < 20:
-                        ch, bold = "*", True
-                    elif age < 40:
-                        ch, bold = "+", False
-                    else:
-                        ch, bold = ".", False
-                    if self.has256:
-                        ci = 50 + (base + min(age // 3, 9)) % 30
-                        attr = curses.color_pair(ci)
-                    else:
-                        attr = curses.color_pair(1 + base % 7)
-                    if bold:
-                        attr |= curses.A_BOLD
+                    ch, attr = looks[(end - 1 - i) // rate + 1]
                     try:
                         stdscr.addch(y, x, ch, attr)
                     except curses.error:
@@ -515,17 +1656,31 @@ class Spirograph:
 
 class RaindropRipples:
     name = "Raindrop Ripples"
+    PALETTES = ("rainbow",)
+    RIPPLES = 10  # most ripples alive at once; drops fall at RIPPLES / 100 per frame
+    BAND = 2.5  # a ring lights cells within BAND of its radius
+    LEVELS = 630  # intensity steps; a multiple of 9, 14 and 10 to keep bands exact
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        self.shades = palette(has256)[RaindropRipples]
+        if np is not None:
+            self.np_shade_chars = np.array([ch for ch, _ in self.shades])
+            self.np_shade_attrs = np.array([attr for _, attr in self.shades])
         self.reset()
 
     def reset(self):
         self.ripples = []
         self.tick = 0
+        self.acc = [0.0] * (self.h * self.w)
 
     def resize(self, h, w):
         self.h, self.w = h, w
+        self.acc = [0.0] * (h * w)
+
+    def counts(self):
+        return {"ripples": len(self.ripples)}
 
     def update(self):
         self.tick += 1
@@ -533,45 +1688,140 @@ class RaindropRipples:
             r["radius"] += 0.8
             r["age"] += 1
         self.ripples = [r for r in self.ripples if r["radius"] < r["max_radius"]]
-        if random.random() < 0.1 and len(self.ripples) < 10:
+        rate = self.RIPPLES * 0.01
+        drops = int(rate) + (self.rng.random() < rate % 1)
+        for _ in range(min(drops, self.RIPPLES - len(self.ripples))):
             self.ripples.append({
-                "cx": random.uniform(0, self.w),
-                "cy": random.uniform(0, self.h),
+                "cx": self.rng.uniform(0, self.w),
+                "cy": self.rng.uniform(0, self.h),
                 "radius": 0.0,
-                "max_radius": random.uniform(min(self.h, self.w) * 0.5,
+                "max_radius": self.rng.uniform(min(self.h, self.w) * 0.5,
                                              max(self.h, self.w) * 1.2),
                 "age": 0,
             })
 
     GRADIENT = " .:-=+*#%@"
 
+    def _spans(self, r):
+        """Yield (y, dy, x0, x1) runs covering the ripple's lit annulus.
+
+        Rows are 2 units tall. The outer circle bounds each row's run and
+        the inner one cuts a hole out of it; both are padded by a cell, so
+        callers still test each cell.
+        """
+        cx, cy, band = r["cx"], r["cy"], self.BAND
+        outer = r["radius"] + band
+        inner = r["radius"] - band
+        for y in range(max(0, math.ceil(cy - outer / 2)),
+                       min(self.h - 1, math.floor(cy + outer / 2)) + 1):
+            dy = (y - cy) * 2
+            half = math.sqrt(max(0.0, outer * outer - dy * dy))
+            x0 = max(0, math.floor(cx - half) - 1)
+            x1 = min(self.w - 1, math.ceil(cx + half) + 1)
+            if inner > 0 and inner * inner > dy * dy:
+                hole = math.sqrt(inner * inner - dy * dy)
+                a, b = math.ceil(cx - hole) + 1, math.floor(cx + hole) - 1
+                if a <= b:
+                    if x0 < a:
+                        yield y, dy, x0, min(x1, a - 1)
+                    if b < x1:
+                        yield y, dy, max(x0, b + 1), x1
+                    continue
+            yield y, dy, x0, x1
+
+    def _accumulate(self):
+        """Add each ripple's ring into the intensity buffer, one annulus at a
+        time; returns the indices that were lit."""
+        acc, w, band = self.acc, self.w, self.BAND
+        sqrt = math.sqrt
+        lit = []
+        for r in self.ripples:
+            rad = r["radius"]
+            cx = r["cx"]
+            fade = max(0.0, 1.0 - rad / r["max_radius"])
+            for y, dy, x0, x1 in self._spans(r):
+                dy2 = dy * dy
+                row = y * w
+                for x in range(x0, x1 + 1):
+                    dx = x - cx
+                    ring = 1.0 - abs(sqrt(dx * dx + dy2) - rad) / band
+                    if ring > 0:
+                        i = row + x
+                        if not acc[i]:
+                            lit.append(i)
+                        acc[i] += ring * fade
+        return lit
+
+    def _accumulate_numpy(self):
+        """Vectorized _accumulate, with the spans of _spans built as arrays."""
+        if not self.ripples:
+            return np.zeros((self.h, self.w))
+        cx, cy, rad, fade = np.array([
+            (r["cx"], r["cy"], r["radius"], max(0.0, 1.0 - r["radius"] / r["max_radius"]))
+            for r in self.ripples]).T
+        outer = rad + self.BAND
+        inner = rad - self.BAND
+        y0 = np.maximum(0, np.ceil(cy - outer / 2)).astype(int)
+        rows = np.maximum(0, np.minimum(self.h - 1, np.floor(cy + outer / 2)).astype(int) - y0 + 1)
+        k = np.repeat(np.arange(len(rows)), rows)
+        y = y0[k] + np.arange(int(rows.sum())) - np.repeat(np.cumsum(rows) - rows, rows)
+        dy = (y - cy[k]) * 2
+        half = np.sqrt(np.maximum(0.0, outer[k] ** 2 - dy * dy))
+        x0 = np.maximum(0, np.floor(cx[k] - half).astype(int) - 1)
+        x1 = np.minimum(self.w - 1, np.ceil(cx[k] + half).astype(int) + 1)
+        hole = np.sqrt(np.maximum(0.0, inner[k] ** 2 - dy * dy))
+        a = np.ceil(cx[k] - hole).astype(int) + 1
+        b = np.floor(cx[k] + hole).astype(int) - 1
+        cut = (inner[k] > 0) & (inner[k] ** 2 > dy * dy) & (a <= b)
+        # left and right run of each row, interleaved to keep ripple order
+        x0 = np.stack((x0, np.where(cut, np.maximum(x0, b + 1), x1 + 1)), 1).ravel()
+        x1 = np.stack((np.where(cut, np.minimum(x1, a - 1), x1), x1), 1).ravel()
+        k, y, dy = (np.repeat(c, 2) for c in (k, y, dy))
+        n = np.maximum(0, x1 - x0 + 1)
+        run = np.repeat(np.arange(len(n)), n)
+        x = x0[run] + np.arange(int(n.sum())) - np.repeat(np.cumsum(n) - n, n)
+        k, dy = k[run], dy[run]
+        dx = x - cx[k]
+        ring = 1.0 - np.abs(np.sqrt(dx * dx + dy * dy) - rad[k]) / self.BAND
+        on = ring > 0
+        # bincount adds in ripple order, like the row loop
+        return np.bincount((y[run] * self.w + x)[on], (ring * fade[k])[on],
+                           self.h * self.w).reshape(self.h, self.w)
+
+    @classmethod
+    def shade(cls, intensity, has256):
+        n = len(cls.GRADIENT)
+        ch = cls.GRADIENT[min(int(intensity * (n - 1)), n - 1)]
+        if has256:
+            # map intensity to cool blue/cyan colors
+            attr = color_pair(clamp(50 + 15 + int((1.0 - intensity) * 14), 50, 79))
+        else:
+            attr = color_pair(6) if intensity < 0.5 else color_pair(7)
+        if intensity > 0.7:
+            attr |= curses.A_BOLD
+        return ch, attr
+
+    def _draw_numpy(self, stdscr):
+        intensity = self._accumulate_numpy()
+        level = shade_level(np.minimum(intensity, 1.0) * self.LEVELS)
+        lit = intensity > 0.05
+        blit_arrays(stdscr, np.where(lit, self.np_shade_chars[level], " "),
+                    np.where(lit, self.np_shade_attrs[level], 0))
+
     def draw(self, stdscr):
-        for y in range(self.h):
-            for x in range(self.w):
-                intensity = 0.0
-                for r in self.ripples:
-                    dx = x - r["cx"]
-                    dy = (y - r["cy"]) * 2  # aspect correction
-                    dist = math.sqrt(dx * dx + dy * dy)
-                    ring = max(0.0, 1.0 - abs(dist - r["radius"]) / 2.5)
-                    fade = max(0.0, 1.0 - r["radius"] / r["max_radius"])
-                    intensity += ring * fade
-                if intensity > 0.05:
-                    intensity = min(intensity, 1.0)
-                    ci = int(intensity * (len(self.GRADIENT) - 1))
-                    ch = self.GRADIENT[clamp(ci, 0, len(self.GRADIENT) - 1)]
-                    if self.has256:
-                        # map intensity to cool blue/cyan colors
-                        pair = 50 + 15 + int((1.0 - intensity) * 14)
-                        attr = curses.color_pair(clamp(pair, 50, 79))
-                    else:
-                        attr = curses.color_pair(6) if intensity < 0.5 else curses.color_pair(7)
-                    if intensity > 0.7:
-                        attr |= curses.A_BOLD
-                    try:
-                        stdscr.addch(y, x, ch, attr)
-                    except curses.error:
-                        pass
+        if np is not None:
+            self._draw_numpy(stdscr)
+            return
+        acc, w, shades, levels = self.acc, self.w, self.shades, self.LEVELS
+        for i in self._accumulate():
+            intensity = acc[i]
+            acc[i] = 0.0
+            if intensity > 0.05:
+                ch, attr = shades[shade_level(min(intensity, 1.0) * levels)]
+                try:
+                    stdscr.addch(i // w, i % w, ch, attr)
+                except curses.error:
+                    pass
 
 
 # ---------------------------------------------------------------------------
@@ -580,20 +1830,24 @@ class RaindropRipples:
 
 class LissajousWeaver:
     name = "Lissajous Weaver"
+    PALETTES = ("greens",)
+    LEVELS = 180  # phosphor intensity steps; thresholds are multiples of 1/20 and 1/9
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        self.shades = palette(has256)[LissajousWeaver]
         self.reset()
 
     def reset(self):
-        self.phosphor = [[0.0] * self.w for _ in range(self.h)]
+        self.phosphor = GlowBuffer(0.93)
         self.beams = []
         ratios = [(3, 2), (5, 4), (3, 4), (7, 6)]
         for i, (a, b) in enumerate(ratios):
             self.beams.append({
                 "a": a, "b": b, "t": 0.0,
-                "delta": random.uniform(0, 2 * math.pi),
-                "delta_drift": random.uniform(0.001, 0.004),
+                "delta": self.rng.uniform(0, 2 * math.pi),
+                "delta_drift": self.rng.uniform(0.001, 0.004),
             })
         self.tick = 0
 
@@ -601,12 +1855,12 @@ class LissajousWeaver:
         self.h, self.w = h, w
         self.reset()
 
+    def counts(self):
+        return {"glowing cells": len(self.phosphor.cells)}
+
     def update(self):
         self.tick += 1
-        # decay phosphor
-        for y in range(self.h):
-            for x in range(self.w):
-                self.phosphor[y][x] *= 0.93
+        self.phosphor.tick()
         cx, cy = self.w / 2, self.h / 2
         sx, sy = self.w * 0.42, self.h * 0.42
         for beam in self.beams:
@@ -621,41 +1875,40 @@ class LissajousWeaver:
                     ny, nx = iy + dy, ix + dx
                     if 0 <= ny < self.h and 0 <= nx < self.w:
                         v = 1.0 if dx == 0 and dy == 0 else 0.5
-                        self.phosphor[ny][nx] = min(1.0, self.phosphor[ny][nx] + v)
+                        self.phosphor.add(ny * self.w + nx, v)
         if self.tick > 600:
             self.tick = 0
             ratios = [(3, 2), (5, 4), (3, 4), (7, 6), (5, 3), (4, 3)]
-            random.shuffle(ratios)
+            self.rng.shuffle(ratios)
             for i, beam in enumerate(self.beams):
                 beam["a"], beam["b"] = ratios[i]
-                beam["delta"] = random.uniform(0, 2 * math.pi)
+                beam["delta"] = self.rng.uniform(0, 2 * math.pi)
+
+    @classmethod
+    def shade(cls, v, has256):
+        if v > 0.8:
+            ch = "\u2588"
+        elif v > 0.5:
+            ch = "#"
+        elif v > 0.3:
+            ch = "*"
+        elif v > 0.15:
+            ch = "+"
+        else:
+            ch = "."
+        attr = color_pair(10 + min(int(v * 9), 9)) if has256 else color_pair(2)
+        if v > 0.6:
+            attr |= curses.A_BOLD
+        return ch, attr
 
     def draw(self, stdscr):
-        for y in range(self.h):
-            for x in range(self.w):
-                v = self.phosphor[y][x]
-                if v > 0.05:
-                    if v > 0.8:
-                        ch = "\u2588"
-                    elif v > 0.5:
-                        ch = "#"
-                    elif v > 0.3:
-                        ch = "*"
-                    elif v > 0.15:
-                        ch = "+"
-                    else:
-                        ch = "."
-                    if self.has256:
-                        shade = clamp(int(v * 9), 0, 9)
-                        attr = curses.color_pair(10 + shade)
-                    else:
-                        attr = curses.color_pair(2)
-                    if v > 0.6:
-                        attr |= curses.A_BOLD
-                    try:
-                        stdscr.addch(y, x, ch, attr)
-                    except curses.error:
-                        pass
+        shades, levels = self.shades, self.LEVELS
+        for i, v in self.phosphor.lit():
+            ch, attr = shades[shade_level(v * levels)]
+            try:
+                stdscr.addch(i // self.w, i % self.w, ch, attr)
+            except curses.error:
+                pass
 
 
 # ---------------------------------------------------------------------------
@@ -664,20 +1917,25 @@ class LissajousWeaver:
 
 class VoronoiLandscape:
     name = "Voronoi Landscape"
+    PALETTES = ("rainbow",)
+    SEEDS = None  # fixed seed count; None picks 12-16 at random
+    # the NumPy path is brute force, so dense mosaics use the row renderer
+    NUMPY_MAX_SEEDS = 64
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
         self.reset()
 
     def reset(self):
         self.seeds = []
-        n = random.randint(12, 16)
+        n = self.SEEDS if self.SEEDS is not None else self.rng.randint(12, 16)
         for i in range(n):
             self.seeds.append({
-                "x": random.uniform(0, self.w),
-                "y": random.uniform(0, self.h),
-                "vx": random.uniform(-0.3, 0.3),
-                "vy": random.uniform(-0.3, 0.3),
+                "x": self.rng.uniform(0, self.w),
+                "y": self.rng.uniform(0, self.h),
+                "vx": self.rng.uniform(-0.3, 0.3),
+                "vy": self.rng.uniform(-0.3, 0.3),
                 "color": i % 30,
             })
 
@@ -685,6 +1943,9 @@ class VoronoiLandscape:
         self.h, self.w = h, w
         self.reset()
 
+    def counts(self):
+        return {"seeds": len(self.seeds)}
+
     def update(self):
         for s in self.seeds:
             s["x"] += s["vx"]
@@ -696,42 +1957,193 @@ class VoronoiLandscape:
                 s["vy"] = -s["vy"]
                 s["y"] = clamp(s["y"], 0, self.h - 1)
             # slight random drift
-            s["vx"] += random.uniform(-0.02, 0.02)
-            s["vy"] += random.uniform(-0.02, 0.02)
+            s["vx"] += self.rng.uniform(-0.02, 0.02)
+            s["vy"] += self.rng.uniform(-0.02, 0.02)
             s["vx"] = clamp(s["vx"], -0.5, 0.5)
             s["vy"] = clamp(s["vy"], -0.5, 0.5)
 
-    def draw(self, stdscr):
-        step = 2 if self.w > 150 else 1
-        for y in range(0, self.h, step):
-            for x in range(0, self.w, step):
-                d1, d2 = 1e9, 1e9
-                nearest = 0
-                for i, s in enumerate(self.seeds):
-                    dx = x - s["x"]
-                    dy = (y - s["y"]) * 2  # aspect correction
-                    d = dx * dx + dy * dy
-                    if d < d1:
-                        d2, d1, nearest = d1, d, i
-                    elif d < d2:
-                        d2 = d
-                edge = math.sqrt(d2) - math.sqrt(d1) if d1 < 1e8 else 999
-                if edge < 1.2:
-                    attr = curses.color_pair(7) | curses.A_BOLD
-                    ch = "\u00b7"
+    def _seed_attrs(self):
+        if self.has256:
+            return [color_pair(50 + s["color"]) for s in self.seeds]
+        return [color_pair(1 + s["color"] % 7) for s in self.seeds]
+
+    def _draw_numpy(self, stdscr):
+        # brute force over all seeds; memory grows with seeds x cells
+        ys = np.arange(self.h, dtype=float)[None, :, None]
+        xs = np.arange(self.w, dtype=float)[None, None, :]
+        sx = np.array([s["x"] for s in self.seeds])[:, None, None]
+        sy = np.array([s["y"] for s in self.seeds])[:, None, None]
+        dx = xs - sx
+        dy = (ys - sy) * 2  # aspect correction
+        d = dx * dx + dy * dy
+        nearest = d.argmin(axis=0)
+        if len(self.seeds) > 1:
+            d1, d2 = np.partition(d, 1, axis=0)[:2]
+        else:
+            d1, d2 = d[0], np.full(d[0].shape, 1e9)
+        border = np.sqrt(d2) - np.sqrt(d1) < 1.2
+        chars = np.where(border, "\u00b7", "\u2588")
+        attrs = np.where(border, color_pair(7) | curses.A_BOLD,
+                         np.array(self._seed_attrs())[nearest])
+        blit_arrays(stdscr, chars, attrs)
+
+    @staticmethod
+    def _envelope(cands):
+        """Lower envelope of the row's distance parabolas (x - sx)^2 + c.
+
+        Returns [(candidate, x_from)], sorted by x_from, where each candidate
+        is nearest from x_from up to the next entry's x_from.
+        """
+        hull = []
+        for cand in sorted(cands):
+            s, c = cand[0], cand[1]
+            start = -math.inf
+            while hull:
+                (s0, c0, *_), z0 = hull[-1]
+                if s == s0:
+                    if c >= c0:
+                        break
+                    hull.pop()
+                    continue
+                # where this parabola drops below the last one on the hull
+                start = ((c + s * s) - (c0 + s0 * s0)) / (2 * (s - s0))
+                if start <= z0:
+                    hull.pop()
+                    start = -math.inf
+                    continue
+                break
+            else:
+                hull.append((cand, start))
+                continue
+            if s != hull[-1][0][0]:
+                hull.append((cand, start))
+        return hull
+
+    def _pieces(self, hull):
+        """Yield (owner, lo, hi): the pixel span of each envelope piece."""
+        last = self.w - 1
+        for k, (cand, start) in enumerate(hull):
+            lo = 0 if k == 0 else max(0, math.ceil(start))
+            hi = last if k == len(hull) - 1 else min(last, math.ceil(hull[k + 1][1]) - 1)
+            if lo <= hi:
+                yield k, cand, lo, hi
+
+    def _farthest(self, hull):
+        """Largest nearest-seed distance anywhere on the row."""
+        return max(max((lo - s) ** 2, (hi - s) ** 2) + c
+                   for _, (s, c, _), lo, hi in self._pieces(hull))
+
+    def _draw_row(self, stdscr, y, cands, hull, seed_attrs, border_attr):
+        """Draw row y; `cands` is sorted by x."""
+        keys = [c[0] for c in cands]
+        sqrt = math.sqrt
+        for _, (sa, ca, ia), lo, hi in self._pieces(hull):
+            attr = seed_attrs[ia]
+            # a border needs another seed within sqrt(f_a) + 1.2, and f_a
+            # peaks at one end of the piece
+            reach = sqrt(max((lo - sa) ** 2, (hi - sa) ** 2) + ca) + 1.2 + 1e-9
+            rivals = [c for c in cands[bisect.bisect_left(keys, lo - reach):
+                                       bisect.bisect_right(keys, hi + reach)]
+                      if c[2] != ia and (clamp(c[0], lo, hi) - c[0]) ** 2 + c[1] < reach * reach]
+            # f_b - f_a is linear in x, and a border needs
+            # f_b < (sqrt(f_a) + 1.2)^2 <= f_a + 2.4 * sqrt(max f_a) + 1.44,
+            # so each rival can only make borders on one side of a cut point
+            limit = 2.4 * sqrt(max((lo - sa) ** 2, (hi - sa) ** 2) + ca) + 1.44
+            zones = []
+            for s, c, _ in rivals:
+                slope = -2 * (s - sa)
+                offset = s * s - sa * sa + c - ca
+                if slope > 0:
+                    zone = (lo, math.floor((limit - offset) / slope) + 1)
+                elif slope < 0:
+                    zone = (math.ceil((limit - offset) / slope) - 1, hi)
                 else:
-                    ci = self.seeds[nearest]["color"]
-                    if self.has256:
-                        attr = curses.color_pair(50 + ci)
-                    else:
-                        attr = curses.color_pair(1 + ci % 7)
-                    ch = "\u2588"
-                try:
-                    stdscr.addch(y, x, ch, attr)
-                    if step == 2 and x + 1 < self.w:
-                        stdscr.addch(y, x + 1, ch, attr)
-                except curses.error:
-                    pass
+                    zone = (lo, hi) if offset < limit else None
+                if zone and zone[0] <= hi and zone[1] >= lo:
+                    zones.append((max(zone[0], lo), min(zone[1], hi)))
+            zones.sort()
+            x = lo
+            for z0, z1 in zones + [(hi + 1, hi + 1)]:
+                if z1 < x:
+                    continue
+                if z0 > x:
+                    n = min(z0, hi + 1) - x
+                    stdscr.blit(y, x, ["\u2588"] * n, [attr] * n)
+                    x += n
+                if x > hi:
+                    break
+                # overlapping zones merge into one per-cell span
+                x1 = z1
+                xs = range(x, x1 + 1)
+                d1 = [(v - sa) * (v - sa) + ca for v in xs]
+                d2 = [1e9] * len(xs)
+                for s, c, _ in rivals:
+                    d2 = list(map(min, d2, [(v - s) * (v - s) + c for v in xs]))
+                border = [sqrt(q) - sqrt(p) < 1.2 for p, q in zip(d1, d2)]
+                stdscr.blit(y, x, ["\u00b7" if e else "\u2588" for e in border],
+                            [border_attr if e else attr for e in border])
+                x = x1 + 1
+
+    def _draw_rows(self, stdscr):
+        """Render row by row from per-row distance envelopes.
+
+        Along one row each seed's squared distance is a parabola in x, so the
+        nearest seed is given by their lower envelope, found in O(seeds) per
+        row. Seeds are bucketed into horizontal bands and a row only gathers
+        the bands close enough to matter. Within each envelope piece only the
+        seeds near enough to draw a border are evaluated, and only on the
+        spans where they can, so cells and borders stay identical to a
+        brute-force scan.
+        """
+        w, h = self.w, self.h
+        seeds = self.seeds
+        band = max(math.sqrt(w * 2 * h / len(seeds)), 1.0)  # in 2y units
+        nbands = int(2 * h / band) + 1
+        bands = [[] for _ in range(nbands)]
+        for i, s in enumerate(seeds):
+            bands[clamp(int(2 * s["y"] / band), 0, nbands - 1)].append((s["x"], s["y"], i))
+        seed_attrs = self._seed_attrs()
+        border_attr = color_pair(7) | curses.A_BOLD
+
+        def gather(y, lo, hi, limit=math.inf):
+            cands = []
+            for b in range(max(lo, 0), min(hi, nbands - 1) + 1):
+                for sx, sy, i in bands[b]:
+                    dy = (y - sy) * 2  # aspect correction
+                    if dy * dy <= limit:
+                        cands.append((sx, dy * dy, i))
+            return cands
+
+        for y in range(h):
+            cb = clamp(int(2 * y / band), 0, nbands - 1)
+            r = 1
+            cands = gather(y, cb - r, cb + r)
+            while not cands:
+                r += 1
+                cands = gather(y, cb - r, cb + r)
+            cands.sort()
+            # only seeds within the farthest nearest-seed distance (plus the
+            # border width) can own a cell or make a border; the seeds found
+            # so far already bound that distance
+            reach = math.sqrt(self._farthest(self._envelope(cands))) + 1.2 + 1e-9
+            limit = reach * reach
+            lo = cb
+            while lo > 0 and 2 * y - lo * band <= reach:
+                lo -= 1
+            hi = cb
+            while hi < nbands - 1 and (hi + 1) * band - 2 * y <= reach:
+                hi += 1
+            cands = gather(y, min(lo, cb - r), max(hi, cb + r), limit)
+            cands.sort()
+            self._draw_row(stdscr, y, cands, self._envelope(cands), seed_attrs, border_attr)
+
+    def draw(self, stdscr):
+        if not self.seeds or not self.w or not self.h:
+            return
+        if np is not None and len(self.seeds) <= self.NUMPY_MAX_SEEDS:
+            self._draw_numpy(stdscr)
+        else:
+            self._draw_rows(stdscr)
 
 
 # ---------------------------------------------------------------------------
@@ -740,54 +2152,146 @@ class VoronoiLandscape:
 
 class FluidParticles:
     name = "Fluid Particles"
+    PALETTES = ("rainbow",)
+    BOIDS = 80
+    RADIUS = 20  # perception radius
+    SPAN = 2  # spatial hash cells are RADIUS / SPAN wide
+    LEVELS = 20  # trail intensity steps
 
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        self.shades = palette(has256)[FluidParticles]
         self.reset()
 
     def reset(self):
+        self._build_grid()
         self.boids = []
-        for _ in range(80):
+        for _ in range(self.BOIDS):
             self.boids.append({
-                "x": random.uniform(0, self.w),
-                "y": random.uniform(0, self.h),
-                "vx": random.uniform(-1, 1),
-                "vy": random.uniform(-0.5, 0.5),
+                "x": self.rng.uniform(0, self.w),
+                "y": self.rng.uniform(0, self.h),
+                "vx": self.rng.uniform(-1, 1),
+                "vy": self.rng.uniform(-0.5, 0.5),
             })
-        self.trail = [[0.0] * self.w for _ in range(self.h)]
+        self.trail = GlowBuffer(0.88)
 
     def resize(self, h, w):
         self.h, self.w = h, w
         self.reset()
 
+    def counts(self):
+        return {"boids": len(self.boids), "trail cells": len(self.trail.cells)}
+
+    def _build_grid(self):
+        """Lay a toroidal grid of cells at least RADIUS / SPAN wide over the
+        screen.
+
+        Every boid within RADIUS of a cell lies within SPAN cells of it,
+        wrapping at the edges; those cells are listed once per cell here.
+        """
+        self._table = None  # built on first use by _build_table
+        size = self.RADIUS / self.SPAN
+        self.cols = cols = max(1, int(self.w // size))
+        self.rows = rows = max(1, int(self.h // size))
+        offsets = range(-self.SPAN, self.SPAN + 1)
+        self.cell_nbrs = [
+            tuple(sorted({((r + dr) % rows) * cols + (c + dc) % cols
+                          for dr in offsets for dc in offsets}))
+            for r in range(rows) for c in range(cols)
+        ]
+
+    def _build_table(self):
+        """Pad cell_nbrs into an array for _flock_numpy.
+
+        When the grid is wide enough that no cell is listed twice, also
+        record the offset that moves each neighbour cell's boids to their
+        nearest image, so pairs skip the per-pair wrap test.
+        """
+        ncells, span = len(self.cell_nbrs), self.SPAN
+        width = max(len(nbrs) for nbrs in self.cell_nbrs)
+        table = np.full((ncells, width), ncells)
+        if self.cols <= 2 * span or self.rows <= 2 * span:
+            for c, nbrs in enumerate(self.cell_nbrs):
+                table[c, :len(nbrs)] = nbrs
+            self._table = table, None, None
+            return
+        shift_x = np.zeros((ncells, width))
+        shift_y = np.zeros((ncells, width))
+        offsets = [(dr, dc) for dr in range(-span, span + 1) for dc in range(-span, span + 1)]
+        for r in range(self.rows):
+            for c in range(self.cols):
+                cell = r * self.cols + c
+                for k, (dr, dc) in enumerate(offsets):
+                    table[cell, k] = ((r + dr) % self.rows) * self.cols + (c + dc) % self.cols
+                    shift_x[cell, k] = (c + dc) // self.cols * self.w
+                    shift_y[cell, k] = (r + dr) // self.rows * self.h
+        self._table = table, shift_x, shift_y
+
+    def _cell(self, x, y):
+        return (min(int(y * self.rows / self.h), self.rows - 1) * self.cols
+                + min(int(x * self.cols / self.w), self.cols - 1))
+
     def update(self):
-        # decay trails
-        for y in range(self.h):
-            for x in range(self.w):
-                self.trail[y][x] *= 0.88
+        self.trail.tick()
+        if np is not None:
+            self._flock_numpy()
+        else:
+            self._flock()
+        # deposit trail
+        for b in self.boids:
+            iy, ix = int(b["y"]), int(b["x"])
+            if 0 <= iy < self.h and 0 <= ix < self.w:
+                self.trail.add(iy * self.w + ix, 0.6)
 
+    def _flock(self):
+        # hash a snapshot of every boid so neighbour lookups only scan the
+        # surrounding cells; steering is computed from the frame's start
+        cells = [[] for _ in self.cell_nbrs]
+        snaps = []
         for b in self.boids:
+            snap = (b["x"], b["y"], b["vx"], b["vy"])
+            cells[self._cell(snap[0], snap[1])].append(snap)
+            snaps.append(snap)
+        w, h = self.w, self.h
+        hw, hh = w / 2, h / 2
+        reach = (self.RADIUS - 0.01) ** 2
+        sqrt = math.sqrt
+
+        for b, me in zip(self.boids, snaps):
+            bx, by = me[0], me[1]
             # flocking: steer toward center, match velocity, avoid crowding
             cx, cy, cvx, cvy, sep_x, sep_y, count = 0, 0, 0, 0, 0, 0, 0
-            for o in self.boids:
-                if o is b:
-                    continue
-                dx = o["x"] - b["x"]
-                dy = o["y"] - b["y"]
-                d = math.sqrt(dx * dx + dy * dy) + 0.01
-                if d < 20:
-                    cx += o["x"]
-                    cy += o["y"]
-                    cvx += o["vx"]
-                    cvy += o["vy"]
-                    count += 1
-                    if d < 4:
-                        sep_x -= dx / d
-                        sep_y -= dy / d
+            for cell in self.cell_nbrs[self._cell(bx, by)]:
+                for o in cells[cell]:
+                    if o is me:
+                        continue
+                    # nearest image across the wrapped edges
+                    dx = o[0] - bx
+                    if dx > hw:
+                        dx -= w
+                    elif dx < -hw:
+                        dx += w
+                    dy = o[1] - by
+                    if dy > hh:
+                        dy -= h
+                    elif dy < -hh:
+                        dy += h
+                    d2 = dx * dx + dy * dy
+                    if d2 < reach:
+                        cx += dx
+                        cy += dy
+                        cvx += o[2]
+                        cvy += o[3]
+                        count += 1
+                        if d2 < 15.9201:  # d < 4, d = dist + 0.01
+                            d = sqrt(d2) + 0.01
+                            sep_x -= dx / d
+                            sep_y -= dy / d
             if count > 0:
-                # cohesion
-                b["vx"] += (cx / count - b["x"]) * 0.005
-                b["vy"] += (cy / count - b["y"]) * 0.005
+                # cohesion, toward the neighbours' centre relative to us
+                b["vx"] += cx / count * 0.005
+                b["vy"] += cy / count * 0.005
                 # alignment
                 b["vx"] += (cvx / count - b["vx"]) * 0.05
                 b["vy"] += (cvy / count - b["vy"]) * 0.05
@@ -804,46 +2308,109 @@ class FluidParticles:
             # wrap
             b["x"] %= self.w
             b["y"] %= self.h
-            # deposit trail
-            iy, ix = int(b["y"]), int(b["x"])
-            if 0 <= iy < self.h and 0 <= ix < self.w:
-                self.trail[iy][ix] = min(1.0, self.trail[iy][ix] + 0.6)
+
+    def _flock_numpy(self):
+        """Vectorized _flock: enumerate candidate pairs from the cell list."""
+        n = len(self.boids)
+        x, y, vx, vy = np.array([(b["x"], b["y"], b["vx"], b["vy"])
+                                 for b in self.boids]).T
+        ncells = len(self.cell_nbrs)
+        cell = (np.minimum((y * self.rows / self.h).astype(int), self.rows - 1) * self.cols
+                + np.minimum((x * self.cols / self.w).astype(int), self.cols - 1))
+        order = np.argsort(cell, kind="stable")
+        counts = np.bincount(cell, minlength=ncells + 1)  # ncells: empty pad cell
+        starts = np.cumsum(counts) - counts
+        if self._table is None:
+            self._build_table()
+        table, shift_x, shift_y = self._table
+        # every (boid, boid in a nearby cell) pair, boid-major
+        nb = table[cell].ravel()
+        m = counts[nb]
+        total = int(m.sum())
+        i = np.repeat(np.arange(n), m.reshape(n, -1).sum(1))
+        j = order[np.repeat(starts[nb] - (np.cumsum(m) - m), m) + np.arange(total)]
+        # each pair shows up both ways round; keep one and credit both boids
+        half = i < j
+        i, j = i[half], j[half]
+        # nearest image across the wrapped edges
+        if shift_x is not None:
+            dx = x[j] - x[i] + np.repeat(shift_x[cell].ravel(), m)[half]
+            dy = y[j] - y[i] + np.repeat(shift_y[cell].ravel(), m)[half]
+        else:
+            dx = x[j] - x[i]
+            dx = np.where(dx > self.w / 2, dx - self.w, np.where(dx < -self.w / 2, dx + self.w, dx))
+            dy = y[j] - y[i]
+            dy = np.where(dy > self.h / 2, dy - self.h, np.where(dy < -self.h / 2, dy + self.h, dy))
+        d2 = dx * dx + dy * dy
+        near = d2 < (self.RADIUS - 0.01) ** 2
+        i, j, dx, dy, d2 = i[near], j[near], dx[near], dy[near], d2[near]
+        both = np.concatenate((i, j))
+        other = np.concatenate((j, i))
+        count = np.bincount(both, minlength=n)
+        cx = np.bincount(i, dx, n) - np.bincount(j, dx, n)
+        cy = np.bincount(i, dy, n) - np.bincount(j, dy, n)
+        cvx = np.bincount(both, vx[other], n)
+        cvy = np.bincount(both, vy[other], n)
+        close = d2 < 15.9201
+        d = np.sqrt(d2[close]) + 0.01
+        ux, uy = dx[close] / d, dy[close] / d
+        i, j = i[close], j[close]
+        sep_x = np.bincount(j, ux, n) - np.bincount(i, ux, n)
+        sep_y = np.bincount(j, uy, n) - np.bincount(i, uy, n)
+        has = count > 0
+        safe = np.maximum(count, 1)
+        vx = np.where(has, vx + cx / safe * 0.005, vx)
+        vy = np.where(has, vy + cy / safe * 0.005, vy)
+        vx = np.where(has, vx + (cvx / safe - vx) * 0.05, vx)
+        vy = np.where(has, vy + (cvy / safe - vy) * 0.05, vy)
+        vx = vx + sep_x * 0.15
+        vy = vy + sep_y * 0.15
+        spd = np.sqrt(vx * vx + vy * vy) + 0.01
+        fast = spd > 1.5
+        vx = np.where(fast, vx / spd * 1.5, vx)
+        vy = np.where(fast, vy / spd * 1.5, vy)
+        x = (x + vx) % self.w
+        y = (y + vy) % self.h
+        for b, bx, by, bvx, bvy in zip(self.boids, x.tolist(), y.tolist(),
+                                       vx.tolist(), vy.tolist()):
+            b["x"], b["y"], b["vx"], b["vy"] = bx, by, bvx, bvy
 
     def draw(self, stdscr):
-        # draw trails
-        for y in range(self.h):
-            for x in range(self.w):
-                v = self.trail[y][x]
-                if v > 0.05:
-                    if v > 0.7:
-                        ch = "\u2588"
-                    elif v > 0.4:
-                        ch = "#"
-                    elif v > 0.2:
-                        ch = "+"
-                    else:
-                        ch = "."
-                    if self.has256:
-                        ci = 50 + int(v * 20)
-                        attr = curses.color_pair(clamp(ci, 50, 79))
-                    else:
-                        attr = curses.color_pair(6)
-                    if v > 0.5:
-                        attr |= curses.A_BOLD
-                    try:
-                        stdscr.addch(y, x, ch, attr)
-                    except curses.error:
-                        pass
+        self._draw_trails(stdscr)
         # draw boid heads
         for b in self.boids:
             iy, ix = int(b["y"]), int(b["x"])
             if 0 <= iy < self.h and 0 <= ix < self.w:
                 try:
                     stdscr.addch(iy, ix, "\u2588",
-                                 curses.color_pair(7) | curses.A_BOLD)
+                                 color_pair(7) | curses.A_BOLD)
                 except curses.error:
                     pass
 
+    @classmethod
+    def shade(cls, v, has256):
+        if v > 0.7:
+            ch = "\u2588"
+        elif v > 0.4:
+            ch = "#"
+        elif v > 0.2:
+            ch = "+"
+        else:
+            ch = "."
+        attr = color_pair(clamp(50 + int(v * 20), 50, 79)) if has256 else color_pair(6)
+        if v > 0.5:
+            attr |= curses.A_BOLD
+        return ch, attr
+
+    def _draw_trails(self, stdscr):
+        shades, levels = self.shades, self.LEVELS
+        for i, v in self.trail.lit():
+            ch, attr = shades[shade_level(v * levels)]
+            try:
+                stdscr.addch(i // self.w, i % self.w, ch, attr)
+            except curses.error:
+                pass
+
 
 # ---------------------------------------------------------------------------
 # Animation: Terrain Map
@@ -851,31 +2418,156 @@ class FluidParticles:
 
 class TerrainMap:
     name = "Terrain Map"
+    PALETTES = ("rainbow",)
     GRADIENT = " .:-=+*#%@"
     # water, sand, grass, forest, mountain, snow
     COLORS_256 = [21, 33, 51, 46, 34, 22, 100, 136, 94, 255]
     COLORS_BASIC = [4, 3, 2, 2, 3, 7]
 
+    MODE = "waves"  # "waves": three sine octaves; "noise": value-noise lattice
+    OCTAVES = 4  # value-noise octaves, each twice the frequency of the last
+    CELL = 24  # columns per lattice cell in the first octave
+    CONTRAST = 1.9  # stretches the noise sum, which bunches up around 0.5
+    LEVELS = 900  # height steps; every band edge is a multiple of 1/9, 1/20 or 1/50
+
     def __init__(self, h, w, has256):
         self.h, self.w, self.has256 = h, w, has256
+        self.rng = exhibit_rng(type(self))
+        self.shades = palette(has256)[TerrainMap]
+        if np is not None:
+            self.np_shade_chars = np.array([ch for ch, _ in self.shades])
+            self.np_shade_attrs = np.array([attr for _, attr in self.shades])
         self.reset()
 
     def reset(self):
         self.t = 0.0
+        # the offsets are fixed for the life of the map; only t animates it
+        ox = self.rng.uniform(0, 1000)
+        oy = self.rng.uniform(0, 1000)
+        if np is not None:
+            self.heightmap = np.zeros((self.h, self.w))
+        else:
+            self.heightmap = [[0.0] * self.w for _ in range(self.h)]
+        if self.MODE == "noise":
+            self._build_lattices()
+        else:
+            self._build_tables(ox, oy)
         self._generate_terrain()
 
+    def _build_tables(self, ox, oy):
+        """Per-resize phase tables for the sine octaves.
+
+        sin(x * 0.11 + y * 0.09 + t / 2) is split with the angle-sum identity,
+        so every term is a column factor times a row factor and only the
+        column factors and one row cosine depend on t.
+        """
+        xs = [x + ox for x in range(self.w)]
+        ys = [y + oy for y in range(self.h)]
+        self.col_phase = ([x * 0.05 for x in xs], [x * 0.11 for x in xs], [x * 0.23 for x in xs])
+        self.row_phase = [y * 0.07 for y in ys]
+        self.row_cos = [0.5 * math.cos(y * 0.09) for y in ys]
+        self.row_sin = [0.5 * math.sin(y * 0.09) for y in ys]
+        self.row_fine = [0.25 * math.sin(y * 0.19) for y in ys]
+
+    def _build_lattices(self):
+        """Random lattices for the value-noise octaves, drawn once per resize.
+
+        Each octave wraps at a period wider than the screen and drifts in its
+        own direction as t advances.
+        """
+        self.lattices = []
+        for o in range(self.OCTAVES):
+            freq = 2 ** o / self.CELL
+            nx = int(self.w * freq) + 2
+            ny = int(self.h * 2 * freq) + 2  # rows are twice as tall as columns
+            heading = self.rng.uniform(0, 2 * math.pi)
+            self.lattices.append((
+                freq, 0.5 ** o, math.cos(heading), math.sin(heading),
+                [[self.rng.random() for _ in range(nx)] for _ in range(ny)],
+            ))
+
+    def _noise_axis(self, n, freq, phase, period):
+        """Lattice indices and smoothstep weights along one axis."""
+        i0, i1, f = [], [], []
+        for p in range(n):
+            u = p * freq + phase
+            k = math.floor(u)
+            s = u - k
+            i0.append(k % period)
+            i1.append((k + 1) % period)
+            f.append(s * s * (3 - 2 * s))
+        return i0, i1, f
+
     def _generate_terrain(self):
-        # multi-octave value noise via sine sums (no imports needed)
-        self.heightmap = [[0.0] * self.w for _ in range(self.h)]
-        ox = random.uniform(0, 1000)
-        oy = random.uniform(0, 1000)
-        for y in range(self.h):
-            for x in range(self.w):
-                v = 0.0
-                v += math.sin((x + ox) * 0.05 + self.t) * math.cos((y + oy) * 0.07 + self.t * 0.3)
-                v += 0.5 * math.sin((x + ox) * 0.11 + (y + oy) * 0.09 + self.t * 0.5)
-                v += 0.25 * math.sin((x + ox) * 0.23 + self.t * 0.7) * math.sin((y + oy) * 0.19)
-                self.heightmap[y][x] = (v + 1.75) / 3.5  # normalize roughly to [0,1]
+        if self.MODE == "noise":
+            if np is not None:
+                self._generate_noise_numpy()
+            else:
+                self._generate_noise()
+            return
+        t = self.t
+        px1, px2, px3 = self.col_phase
+        if np is not None:
+            s1 = np.sin(np.add(px1, t))
+            s2 = np.sin(np.add(px2, t * 0.5))
+            c2 = np.cos(np.add(px2, t * 0.5))
+            s3 = np.sin(np.add(px3, t * 0.7))
+            k1 = np.cos(np.add(self.row_phase, t * 0.3))[:, None]
+            hm = self.heightmap
+            np.multiply(s1, k1, out=hm)
+            hm += s2 * np.array(self.row_cos)[:, None]
+            hm += c2 * np.array(self.row_sin)[:, None]
+            hm += s3 * np.array(self.row_fine)[:, None]
+            hm += 1.75
+            hm /= 3.5
+            return
+        sin = math.sin
+        s1 = [sin(p + t) for p in px1]
+        s2 = [sin(p + t * 0.5) for p in px2]
+        c2 = [math.cos(p + t * 0.5) for p in px2]
+        s3 = [sin(p + t * 0.7) for p in px3]
+        cols = list(zip(s1, s2, c2, s3))
+        for row, py, k2, k3, k4 in zip(self.heightmap, self.row_phase,
+                                       self.row_cos, self.row_sin, self.row_fine):
+            k1 = math.cos(py + t * 0.3)
+            # normalize roughly to [0,1]
+            row[:] = [(a * k1 + b * k2 + c * k3 + d * k4 + 1.75) / 3.5
+                      for a, b, c, d in cols]
+
+    def _generate_noise(self):
+        total = sum(amp for _, amp, _, _, _ in self.lattices)
+        rows = self.heightmap
+        for row in rows:
+            row[:] = [0.0] * self.w
+        for freq, amp, hx, hy, lattice in self.lattices:
+            i0, i1, fx = self._noise_axis(self.w, freq, self.t * hx, len(lattice[0]))
+            j0, j1, fy = self._noise_axis(self.h, freq * 2, self.t * hy, len(lattice))
+            # blend each lattice row across the screen once, then between rows
+            blended = {}
+            for j in set(j0) | set(j1):
+                lat = lattice[j]
+                blended[j] = [lat[a] + (lat[b] - lat[a]) * f for a, b, f in zip(i0, i1, fx)]
+            for row, a, b, f in zip(rows, j0, j1, fy):
+                row[:] = [acc + amp * (p + (q - p) * f)
+                          for acc, p, q in zip(row, blended[a], blended[b])]
+        scale = self.CONTRAST / total
+        for row in rows:
+            row[:] = [(v - total / 2) * scale + 0.5 for v in row]
+
+    def _generate_noise_numpy(self):
+        total = sum(amp for _, amp, _, _, _ in self.lattices)
+        hm = self.heightmap
+        hm[:] = 0.0
+        for freq, amp, hx, hy, lattice in self.lattices:
+            lattice = np.array(lattice)
+            i0, i1, fx = map(np.array, self._noise_axis(self.w, freq, self.t * hx, lattice.shape[1]))
+            j0, j1, fy = map(np.array, self._noise_axis(self.h, freq * 2, self.t * hy, lattice.shape[0]))
+            top = lattice[j0][:, i0] + (lattice[j0][:, i1] - lattice[j0][:, i0]) * fx
+            bottom = lattice[j1][:, i0] + (lattice[j1][:, i1] - lattice[j1][:, i0]) * fx
+            hm += amp * (top + (bottom - top) * fy[:, None])
+        hm -= total / 2
+        hm *= self.CONTRAST / total
+        hm += 0.5
 
     def resize(self, h, w):
         self.h, self.w = h, w
@@ -885,41 +2577,52 @@ class TerrainMap:
         self.t += 0.03
         self._generate_terrain()
 
+    @classmethod
+    def shade(cls, h, has256):
+        ch = cls.GRADIENT[min(int(h * (len(cls.GRADIENT) - 1)), len(cls.GRADIENT) - 1)]
+        if has256:
+            # map height to terrain color
+            if h < 0.3:
+                pair = 50 + 19  # deep blue
+            elif h < 0.38:
+                pair = 50 + 17  # shallow blue
+            elif h < 0.42:
+                pair = 50 + 3   # sand/yellow
+            elif h < 0.6:
+                pair = 50 + 8   # green
+            elif h < 0.75:
+                pair = 50 + 10  # darker green
+            elif h < 0.85:
+                pair = 50 + 5   # yellow-brown
+            else:
+                pair = 50 + 0   # snow/peak (bright red-white)
+                ch = "^"
+            attr = color_pair(pair)
+        else:
+            if h < 0.35:
+                attr = color_pair(4)
+            elif h < 0.5:
+                attr = color_pair(2)
+            elif h < 0.75:
+                attr = color_pair(3)
+            else:
+                attr = color_pair(7)
+        if h > 0.7:
+            attr |= curses.A_BOLD
+        return ch, attr
+
+    def _draw_numpy(self, stdscr):
+        level = shade_level(np.clip(self.heightmap, 0.0, 1.0) * self.LEVELS)
+        blit_arrays(stdscr, self.np_shade_chars[level], self.np_shade_attrs[level])
+
     def draw(self, stdscr):
-        for y in range(self.h):
-            for x in range(self.w):
-                h = clamp(self.heightmap[y][x], 0.0, 1.0)
-                ci = int(h * (len(self.GRADIENT) - 1))
-                ch = self.GRADIENT[ci]
-                if self.has256:
-                    # map height to terrain color
-                    if h < 0.3:
-                        pair = 50 + 19  # deep blue
-                    elif h < 0.38:
-                        pair = 50 + 17  # shallow blue
-                    elif h < 0.42:
-                        pair = 50 + 3   # sand/yellow
-                    elif h < 0.6:
-                        pair = 50 + 8   # green
-                    elif h < 0.75:
-                        pair = 50 + 10  # darker green
-                    elif h < 0.85:
-                        pair = 50 + 5   # yellow-brown
-                    else:
-                        pair = 50 + 0   # snow/peak (bright red-white)
-                        ch = "^"
-                    attr = curses.color_pair(pair)
-                else:
-                    if h < 0.35:
-                        attr = curses.color_pair(4)
-                    elif h < 0.5:
-                        attr = curses.color_pair(2)
-                    elif h < 0.75:
-                        attr = curses.color_pair(3)
-                    else:
-                        attr = curses.color_pair(7)
-                if h > 0.7:
-                    attr |= curses.A_BOLD
+        if np is not None:
+            self._draw_numpy(stdscr)
+            return
+        shades, levels = self.shades, self.LEVELS
+        for y, row in enumerate(self.heightmap):
+            for x, h in enumerate(row):
+                ch, attr = shades[shade_level(clamp(h, 0.0, 1.0) * levels)]
                 try:
                     stdscr.addch(y, x, ch, attr)
                 except curses.error:
@@ -930,9 +2633,25 @@ class TerrainMap:
 # Main loop
 # ---------------------------------------------------------------------------
 
+EXHIBITS = [
+    MatrixRain,
+    Starfield,
+    Fireworks,
+    GameOfLife,
+    PlasmaWaves,
+    MazeGenerator,
+    Spirograph,
+    RaindropRipples,
+    LissajousWeaver,
+    VoronoiLandscape,
+    FluidParticles,
+    TerrainMap,
+]
+
+
 def draw_status_bar(stdscr, h, w, anim_name, idx, total, paused):
     bar = f" [{idx+1}/{total}] {anim_name}"
-    controls = " \u2190/\u2192:switch  1-0:jump  Space:pause  r:reset  q:quit "
+    controls = " \u2190/\u2192:switch  1-0:jump  Space:pause  r:reset  p:perf  q:quit "
     if paused:
         bar += "  [PAUSED]"
     pad = w - len(bar) - len(controls)
@@ -942,76 +2661,1251 @@ def draw_status_bar(stdscr, h, w, anim_name, idx, total, paused):
     line = bar + " " * max(pad, 0) + controls
     line = line[:w]
     try:
-        stdscr.addstr(h - 1, 0, line, curses.color_pair(0) | curses.A_REVERSE)
+        stdscr.addstr(h - 1, 0, line, color_pair(0) | curses.A_REVERSE)
     except curses.error:
         pass
 
 
-def main(stdscr):
+def draw_hud(stdscr, w, stats):
+    """Overlay a FrameStats snapshot in the top-right corner."""
+    def ms(v):
+        return f"{v:7.2f} ms" if v is not None else "      -"
+    written = stats["cells_written"]
+    lines = [
+        f"update  {ms(stats['update_ms'])}",
+        f"draw    {ms(stats['draw_ms'])}",
+        f"refresh {ms(stats['refresh_ms'])}",
+        f"cells   {written if written is not None else '-':>7}",
+        f"fps {stats['fps']:6.1f} / {stats['target_fps']:g}",
+    ]
+    lines += [f"{name:<13}{n:>7}" for name, n in stats["counts"].items()]
+    width = max(len(line) for line in lines) + 2
+    x = max(0, w - width)
+    for y, line in enumerate(lines):
+        try:
+            stdscr.addstr(y, x, f" {line:<{width - 2}} "[:w], color_pair(0) | curses.A_REVERSE)
+        except curses.error:
+            pass
+
+
+class FrameStats:
+    """Timings of the last WINDOW frames, for the performance HUD and
+    --stats-file."""
+
+    WINDOW = 30
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.clear()
+
+    def clear(self):
+        self.updates = deque(maxlen=self.WINDOW)  # seconds per update() step
+        self.draws = deque(maxlen=self.WINDOW)
+        self.refreshes = deque(maxlen=self.WINDOW)  # present() plus refresh()
+        self.renders = deque(maxlen=self.WINDOW)  # when frames were drawn
+        self.written = None  # cells sent by the last present()
+
+    def updated(self, secs, steps):
+        self.updates.append(secs / steps)
+
+    def drew(self, secs):
+        self.draws.append(secs)
+        self.renders.append(self.clock())
+
+    def presented(self, secs, written):
+        self.refreshes.append(secs)
+        self.written = written
+
+    def snapshot(self, anim):
+        """The current averages as a JSON-friendly dict."""
+        def ms(samples):
+            return round(sum(samples) / len(samples) * 1e3, 3) if samples else None
+        renders = self.renders
+        span = renders[-1] - renders[0] if len(renders) > 1 else 0.0
+        counts = getattr(anim, "counts", None)
+        return {
+            "exhibit": anim.name,
+            "fps": round((len(renders) - 1) / span, 2) if span > 0 else 0.0,
+            "target_fps": FrameScheduler.FPS,
+            "update_ms": ms(self.updates),
+            "draw_ms": ms(self.draws),
+            "refresh_ms": ms(self.refreshes),
+            "cells_written": self.written,
+            "counts": counts() if counts else {},
+        }
+
+
+class StatsFile:
+    """Appends a FrameStats snapshot as a JSON line every INTERVAL seconds."""
+
+    INTERVAL = 1.0
+
+    def __init__(self, path, clock=time.perf_counter):
+        self.file = open(path, "a", encoding="utf-8")
+        self.clock = clock
+        self.next = clock() + self.INTERVAL
+
+    def tick(self, gallery):
+        now = self.clock()
+        if now < self.next:
+            return
+        self.next = max(self.next + self.INTERVAL, now)
+        record = {"time": round(time.time(), 3), "size": list(gallery.screen.getmaxyx())}
+        record.update(gallery.snapshot())
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class FrameScheduler:
+    """Fixed-timestep clock that decouples simulation from rendering.
+
+    Real time flows into an accumulator that is drained in steps of
+    1 / SIM_HZ, so exhibits animate at the same speed however long a frame
+    takes to draw. Frames are rendered at most FPS times a second; when the
+    loop falls behind, renders are dropped but simulation steps are not.
+    """
+
+    SIM_HZ = 30  # exhibit update() calls per second
+    FPS = 30  # most frames rendered per second
+    MAX_LAG = 1.0  # seconds of backlog kept, e.g. after the process was stopped
+
+    def __init__(self, clock=time.perf_counter, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.step = 1.0 / self.SIM_HZ
+        self.frame = 1.0 / self.FPS
+        self.last = self.next_frame = clock()
+        self.lag = 0.0
+
+    def steps(self):
+        """Return how many simulation steps are due since the last call."""
+        now = self.clock()
+        self.lag = min(self.lag + now - self.last, self.MAX_LAG)
+        self.last = now
+        n = int(self.lag / self.step)
+        self.lag -= n * self.step
+        return n
+
+    def render_due(self):
+        """Whether a frame may be rendered now; claims the frame slot if so."""
+        now = self.clock()
+        if now < self.next_frame:
+            return False
+        # a late frame pushes the schedule back instead of bunching renders
+        self.next_frame = max(self.next_frame + self.frame, now)
+        return True
+
+    def wait(self, dirty=True):
+        """Sleep until the next simulation step, or the next frame if one is
+        waiting to be rendered (dirty)."""
+        now = self.clock()
+        deadline = self.last + self.step - self.lag
+        if dirty:
+            deadline = min(deadline, self.next_frame)
+        delay = deadline - now
+        if delay > 0:
+            self.sleep(delay)
+
+
+# key -> (rows, columns, zoom steps) for exhibits with a camera
+CAMERA_KEYS = {ord("w"): (-1, 0, 0), ord("s"): (1, 0, 0), ord("a"): (0, -1, 0),
+               ord("d"): (0, 1, 0), ord("+"): (0, 0, -1), ord("="): (0, 0, -1),
+               ord("-"): (0, 0, 1)}
+
+
+def key_command(key):
+    """Translate a key press into a Gallery command tuple, or None."""
+    if key == curses.KEY_RIGHT:
+        return ("step", 1)
+    if key == curses.KEY_LEFT:
+        return ("step", -1)
+    if ord("1") <= key <= ord("9"):
+        return ("show", key - ord("1"))
+    if key == ord("0"):
+        return ("show", 9)
+    if key == ord(" "):
+        return ("pause",)
+    if key == ord("r"):
+        return ("reset",)
+    if key == ord("p"):
+        return ("hud",)
+    if key in CAMERA_KEYS:
+        return ("camera",) + CAMERA_KEYS[key]
+    return None
+
+
+class Gallery:
+    """The exhibits and which one is on show, rendered into a back buffer.
+
+    Only the exhibit on show is ever visible, so exhibits are built and
+    resized lazily when they are shown: a resize just records the new
+    geometry, and each exhibit catches up with it the next time it is used.
+    Exhibits that have not been shown for IDLE_RELEASE seconds are dropped
+    to free their buffers and start afresh when shown again.
+
+    Runs in the curses process normally, or in the simulation worker when
+    the gallery is pipelined (see SimulationWorker).
+    """
+
+    IDLE_RELEASE = 0.0  # seconds before a hidden exhibit is released; 0 keeps them all
+
+    def __init__(self, h, w, has256, clock=time.monotonic):
+        self.has256 = has256
+        self.clock = clock
+        self.size = (h - 1, w)  # exhibit geometry; the last row is the status bar
+        self.animations = [None] * len(EXHIBITS)  # built on first show
+        self.hidden = [None] * len(EXHIBITS)  # when each exhibit was last on show
+        self.current = 0
+        self.paused = False
+        self.screen = CellBuffer(h, w)  # back buffer, flushed to stdscr by present()
+        self.shown = None  # exhibit whose pixels are currently in the back buffer
+        self.dirty = True  # something changed since the last render
+        self.stats = FrameStats()
+        self.hud = False  # performance overlay, toggled with p
+        self.step_cost = 0.0  # seconds per update() of the current exhibit, last measured
+
+    def exhibit(self):
+        """The current exhibit, built or resized to the screen first if needed."""
+        anim = self.animations[self.current]
+        if anim is None:
+            anim = self.animations[self.current] = EXHIBITS[self.current](*self.size, self.has256)
+        elif (anim.h, anim.w) != self.size:
+            anim.resize(*self.size)
+        return anim
+
+    def command(self, name, *args):
+        if name in ("step", "show"):
+            previous = self.current
+            if name == "step":
+                self.current = (self.current + args[0]) % len(self.animations)
+            else:
+                self.current = args[0]
+            if self.current != previous:
+                self.hidden[previous] = self.clock()
+                self.hidden[self.current] = None
+                self.stats.clear()
+                self.step_cost = 0.0
+        elif name == "hud":
+            self.hud = not self.hud
+            self.shown = None  # incremental exhibits must repaint under the overlay
+        elif name == "pause":
+            self.paused = not self.paused
+        elif name == "reset":
+            self.exhibit().reset()
+        elif name == "camera":
+            camera = getattr(self.exhibit(), "camera", None)
+            if camera:
+                camera(*args)
+        elif name == "resize":
+            h, w = args
+            self.size = (h - 1, w)
+            self.screen.resize(h, w)
+            self.shown = None
+        self.dirty = True
+
+    def release_idle(self):
+        """Drop hidden exhibits that have been idle for IDLE_RELEASE seconds."""
+        if self.IDLE_RELEASE <= 0:
+            return
+        cutoff = self.clock() - self.IDLE_RELEASE
+        for i, since in enumerate(self.hidden):
+            if since is not None and since <= cutoff and self.animations[i] is not None:
+                if self.animations[i] is self.shown:
+                    self.shown = None
+                self.animations[i] = None
+                self.hidden[i] = None
+
+    def update(self, steps):
+        if steps:
+            self.release_idle()
+        if steps and not self.paused:
+            anim = self.exhibit()
+            # An exhibit whose steps alone take longer than real time would
+            # spend every loop catching up and never render; it runs in slow
+            # motion instead, one step per frame. Anything faster runs every
+            # due step, dropping renders rather than steps.
+            if self.step_cost >= 1.0 / FrameScheduler.SIM_HZ:
+                steps = 1
+            start = time.perf_counter()
+            for _ in range(steps):
+                anim.update()
+            elapsed = time.perf_counter() - start
+            self.step_cost = elapsed / steps
+            self.stats.updated(elapsed, steps)
+            self.dirty = True
+
+    def snapshot(self):
+        """FrameStats of the current exhibit, with its object counts."""
+        return self.stats.snapshot(self.exhibit())
+
+    def render(self):
+        """Draw the current exhibit into the back buffer; returns its label."""
+        anim = self.exhibit()
+        # incremental exhibits only redraw what changed on top of last frame
+        if not getattr(anim, "incremental", False):
+            self.screen.erase()
+        elif anim is not self.shown:
+            self.screen.erase()
+            anim.invalidate()
+        self.shown = anim
+        start = time.perf_counter()
+        anim.draw(self.screen)
+        self.stats.drew(time.perf_counter() - start)
+        if self.hud:
+            draw_hud(self.screen, self.screen.w, self.stats.snapshot(anim))
+        self.dirty = False
+        label = anim.name
+        status = getattr(anim, "status", None)
+        if status and status():
+            label += f"  ({status()})"
+        return label
+
+
+class StartupProfile:
+    """Wall-clock time of each startup stage up to the first frame on
+    screen (--startup-profile)."""
+
+    BUDGET = 0.1  # seconds from module import to the first frame
+
+    def __init__(self, imported):
+        self.last = imported
+        self.stages = [("module import", imported - STARTED)]
+        self.extra = []  # work measured after the first frame
+
+    def mark(self, stage):
+        """Record the time since the previous mark as `stage`."""
+        now = time.perf_counter()
+        self.stages.append((stage, now - self.last))
+        self.last = now
+
+    def report(self, out=sys.stdout):
+        width = max(len(stage) for stage, _ in self.stages + self.extra)
+        for stage, secs in self.stages:
+            print(f"{stage:<{width}} {secs * 1e3:>8.1f}ms", file=out)
+        total = sum(secs for _, secs in self.stages)
+        verdict = "within" if total <= self.BUDGET else "OVER"
+        print(f"{'first frame':<{width}} {total * 1e3:>8.1f}ms  "
+              f"({verdict} the {self.BUDGET * 1e3:.0f}ms budget)", file=out)
+        if self.extra:
+            print("\nnot on the startup path:", file=out)
+            for stage, secs in self.extra:
+                print(f"{stage:<{width}} {secs * 1e3:>8.1f}ms", file=out)
+
+
+def profile_exhibits(profile, h, w, has256):
+    """Time constructing every exhibit, for the startup report."""
+    for cls in EXHIBITS:
+        start = time.perf_counter()
+        cls(h - 1, w, has256)
+        profile.extra.append((f"construct {cls.name}", time.perf_counter() - start))
+
+
+def main(stdscr, args=None, profile=None):
+    mark = profile.mark if profile else lambda stage: None
+    mark("curses setup")
     curses.curs_set(0)
     stdscr.nodelay(True)
-    stdscr.timeout(33)  # ~30 fps
-    has256 = init_colors(stdscr)
-
+    # the first exhibit's colors now, the rest once its first frame is up
+    has256 = init_colors(stdscr, EXHIBITS[0].PALETTES)
+    mark("init_colors")
     h, w = stdscr.getmaxyx()
-    # reserve last row for status
-    ah = h - 1
-
-    animations = [
-        MatrixRain(ah, w, has256),
-        Starfield(ah, w, has256),
-        Fireworks(ah, w, has256),
-        GameOfLife(ah, w, has256),
-        PlasmaWaves(ah, w, has256),
-        MazeGenerator(ah, w, has256),
-        Spirograph(ah, w, has256),
-        RaindropRipples(ah, w, has256),
-        LissajousWeaver(ah, w, has256),
-        VoronoiLandscape(ah, w, has256),
-        FluidParticles(ah, w, has256),
-        TerrainMap(ah, w, has256),
-    ]
-    current = 0
-    paused = False
+    if args is not None and args.pipeline:
+        if has256:
+            init_palettes(PALETTES)
+        run_pipelined(stdscr, h, w, has256, args)
+        return
+
+    gallery = Gallery(h, w, has256)
+    gallery.exhibit()
+    mark(f"construct {EXHIBITS[0].name}")
+    gallery.update(1)
+    mark("first update")
+    label = gallery.render()
+    mark("first draw")
+    draw_status_bar(gallery.screen, h, w, label, gallery.current,
+                    len(gallery.animations), gallery.paused)
+    gallery.screen.present(stdscr)
+    stdscr.refresh()
+    mark("first refresh")
+    if has256:
+        init_palettes(name for name in PALETTES if name not in EXHIBITS[0].PALETTES)
+    if profile:
+        profile_exhibits(profile, h, w, has256)
+        return
+
+    stats_file = StatsFile(args.stats_file) if args is not None and args.stats_file else None
+    recorder = Recorder(args.record) if args is not None and args.record else None
+    clock = FrameScheduler()
+    try:
+        while True:
+            key = stdscr.getch()
+            if key == ord("q"):
+                break
+            if key != -1:
+                command = key_command(key)
+                if command:
+                    gallery.command(*command)
+                gallery.dirty = True
+
+            # check for resize even without KEY_RESIZE
+            nh, nw = stdscr.getmaxyx()
+            if nh != h or nw != w:
+                h, w = nh, nw
+                gallery.command("resize", h, w)
+                stdscr.erase()
+
+            gallery.update(clock.steps())
+            if stats_file:
+                stats_file.tick(gallery)
+            if not gallery.dirty or not clock.render_due():
+                clock.wait(gallery.dirty)
+                continue
+            label = gallery.render()
+            draw_status_bar(gallery.screen, h, w, label, gallery.current,
+                            len(gallery.animations), gallery.paused)
+            if recorder:
+                recorder.add(gallery.screen)
+            start = time.perf_counter()
+            gallery.screen.present(stdscr)
+            stdscr.refresh()
+            gallery.stats.presented(time.perf_counter() - start, gallery.screen.written)
+            clock.wait(gallery.dirty)
+    finally:
+        if stats_file:
+            stats_file.close()
+        if recorder:
+            recorder.close()
+
+
+# ---------------------------------------------------------------------------
+# Pipelined simulation
+# ---------------------------------------------------------------------------
+
+class SharedFrames:
+    """Rendered frames handed from the simulation worker to the curses
+    process through shared memory.
+
+    There are three frame slots, so each side always has one to itself:
+    the worker fills a slot that is neither the latest frame nor the one
+    being read, then publishes it as latest; the curses process marks the
+    latest slot as being read while it copies it out. The small header is
+    guarded by a lock, the cell data is not, and a frame is never torn.
+    """
+
+    SLOTS = 3
+    META = 5  # per slot: h, w, current exhibit, paused, label length
+    LABEL = 256  # bytes of UTF-8 status label per slot
+
+    def __init__(self, lock, cells=0, name=None):
+        self.lock = lock
+        header = 8 * (3 + self.SLOTS * self.META) + self.SLOTS * self.LABEL
+        from multiprocessing import shared_memory  # Python 3.8+, kept off the startup path
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=header + self.SLOTS * 12 * cells)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.cells = (self.shm.size - header) // (self.SLOTS * 12)
+        buf = self.shm.buf
+        self.header = buf[:8 * 3].cast("q")  # latest slot, sequence, slot being read
+        self.meta = buf[8 * 3:8 * (3 + self.SLOTS * self.META)].cast("q")
+        labels = 8 * (3 + self.SLOTS * self.META)
+        self.labels = [buf[labels + s * self.LABEL:labels + (s + 1) * self.LABEL]
+                       for s in range(self.SLOTS)]
+        data = header
+        self.attrs, self.chars = [], []
+        for _ in range(self.SLOTS):
+            self.attrs.append(buf[data:data + 8 * self.cells].cast("q"))
+            data += 8 * self.cells
+            self.chars.append(buf[data:data + 4 * self.cells].cast("I"))
+            data += 4 * self.cells
+        if name is None:
+            self.header[0], self.header[1], self.header[2] = -1, 0, -1
+
+    def publish(self, screen, label, current, paused):
+        """Copy a rendered back buffer into a free slot and make it latest."""
+        with self.lock:
+            latest, reading = self.header[0], self.header[2]
+            slot = next(s for s in range(self.SLOTS) if s != latest and s != reading)
+        n = screen.h * screen.w
+        self.attrs[slot][:n] = array("q", screen.attrs)
+        self.chars[slot][:n] = array("I", map(ord, screen.chars))
+        text = label.encode("utf-8")[:self.LABEL]
+        self.labels[slot][:len(text)] = text
+        base = slot * self.META
+        self.meta[base:base + self.META] = array("q", (screen.h, screen.w, current,
+                                                       int(paused), len(text)))
+        with self.lock:
+            self.header[0] = slot
+            self.header[1] += 1
+
+    def take(self, screen, seen):
+        """Copy the latest frame into `screen` if it is newer than sequence
+        `seen` and matches the screen's size.
+
+        Returns (sequence, label, current exhibit, paused), or None.
+        """
+        with self.lock:
+            slot, seq = self.header[0], self.header[1]
+            if slot < 0 or seq == seen:
+                return None
+            self.header[2] = slot
+        try:
+            h, w, current, paused, size = self.meta[slot * self.META:(slot + 1) * self.META]
+            if (h, w) != (screen.h, screen.w):
+                return None
+            n = h * w
+            screen.attrs[:] = self.attrs[slot][:n].tolist()
+            screen.chars[:] = map(chr, self.chars[slot][:n])
+            label = bytes(self.labels[slot][:size]).decode("utf-8", "replace")
+        finally:
+            with self.lock:
+                self.header[2] = -1
+        return seq, label, current, bool(paused)
+
+    def close(self, unlink=False):
+        for view in [self.header, self.meta] + self.labels + self.attrs + self.chars:
+            view.release()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def simulate(conn, lock, name, h, w, has256, args):
+    """Worker process: run the gallery and publish frames to SharedFrames."""
+    use_headless_colors()  # encodes color pairs exactly like curses.color_pair
+    configure(args)
+    frames = SharedFrames(lock, name=name)
+    gallery = Gallery(h, w, has256)
+    # sleep by waiting on the pipe, so commands are picked up at once
+    clock = FrameScheduler(sleep=conn.poll)
+    # presenting happens in the curses process, so refresh_ms stays null here
+    stats_file = StatsFile(args.stats_file) if args.stats_file else None
+    try:
+        while True:
+            while conn.poll():
+                command = conn.recv()
+                if command[0] == "quit":
+                    return
+                if command[0] == "resize":
+                    h, w, name = command[1:]
+                    if name != frames.name:
+                        frames.close()
+                        frames = SharedFrames(lock, name=name)
+                    gallery.command("resize", h, w)
+                else:
+                    gallery.command(*command)
+            gallery.update(clock.steps())
+            if stats_file:
+                stats_file.tick(gallery)
+            if gallery.dirty and clock.render_due():
+                label = gallery.render()
+                frames.publish(gallery.screen, label, gallery.current, gallery.paused)
+                conn.send(("frame",))
+            clock.wait(gallery.dirty)
+    finally:
+        frames.close()
+        if stats_file:
+            stats_file.close()
+
+
+class SimulationWorker:
+    """Runs the gallery's update() and draw() in a separate process.
+
+    The curses process forwards key commands and resizes to it and only
+    copies finished frames out of shared memory and presents them, so
+    simulating frame N+1 overlaps with writing frame N to the terminal.
+    """
+
+    def __init__(self, h, w, has256, args):
+        import multiprocessing
+        ctx = multiprocessing.get_context("spawn")
+        self.lock = ctx.Lock()
+        self.frames = SharedFrames(self.lock, cells=h * w)
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=simulate, daemon=True, args=(
+            child, self.lock, self.frames.name, h, w, has256, args))
+        self.process.start()
+        child.close()
+
+    def send(self, command):
+        self.conn.send(command)
 
+    def resize(self, h, w):
+        if h * w > self.frames.cells:
+            old, self.frames = self.frames, SharedFrames(self.lock, cells=h * w)
+            old.close(unlink=True)  # the worker keeps its mapping until it switches
+        self.conn.send(("resize", h, w, self.frames.name))
+
+    def wait(self, timeout):
+        """Sleep until the worker signals a new frame or `timeout` passes."""
+        try:
+            while self.conn.poll(timeout):
+                self.conn.recv()
+                timeout = 0
+        except EOFError:
+            raise SystemExit("the simulation worker exited unexpectedly")
+
+    def close(self):
+        try:
+            self.conn.send(("quit",))
+        except OSError:
+            pass
+        self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.frames.close(unlink=True)
+
+
+def run_pipelined(stdscr, h, w, has256, args):
+    """Interactive loop that presents frames simulated by a worker process."""
+    worker = SimulationWorker(h, w, has256, args)
+    screen = CellBuffer(h, w)
+    recorder = Recorder(args.record) if args.record else None
+    seen = None
+    try:
+        while True:
+            key = stdscr.getch()
+            if key == ord("q"):
+                break
+            command = key_command(key) if key != -1 else None
+            if command:
+                worker.send(command)
+
+            # check for resize even without KEY_RESIZE
+            nh, nw = stdscr.getmaxyx()
+            if nh != h or nw != w:
+                h, w = nh, nw
+                worker.resize(h, w)
+                screen.resize(h, w)
+                stdscr.erase()
+
+            frame = worker.frames.take(screen, seen)
+            if frame is None:
+                worker.wait(0.005)
+                continue
+            seen, label, current, paused = frame
+            draw_status_bar(screen, h, w, label, current, len(EXHIBITS), paused)
+            if recorder:
+                recorder.add(screen)
+            screen.present(stdscr)
+            stdscr.refresh()
+    finally:
+        worker.close()
+        if recorder:
+            recorder.close()
+
+
+# ---------------------------------------------------------------------------
+# Recording and replay
+# ---------------------------------------------------------------------------
+
+def pack_ints(typecode, values):
+    """Little-endian bytes of an array of ints."""
+    a = array(typecode, values)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tobytes()
+
+def unpack_ints(typecode, data):
+    a = array(typecode)
+    a.frombytes(data)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+
+class Recorder:
+    """Writes presented frames to a compact binary recording.
+
+    The file is MAGIC followed by one record per frame: a RECORD header
+    (kind, seconds since recording started, payload size) and a
+    zlib-compressed payload. A keyframe (kind K) holds the screen size and
+    every cell; other frames (kind D) hold only the runs of cells that
+    changed since the frame before. Keyframes are written every KEYFRAME
+    frames and whenever the size changes, so playback can seek by decoding
+    from the nearest keyframe. Integers are little-endian.
+    """
+
+    MAGIC = b"ART-GALLERY-REC 1\n"
+    RECORD = struct.Struct("<cdI")
+    KEYFRAME = 150  # frames between keyframes, 5 seconds at 30 fps
+
+    def __init__(self, path, clock=time.perf_counter):
+        self.file = open(path, "wb")
+        self.file.write(self.MAGIC)
+        self.clock = clock
+        self.start = clock()
+        self.frames = 0
+        self.size = None
+        self.chars, self.attrs = [], []
+
+    def add(self, screen):
+        """Append the contents of a CellBuffer as the next frame."""
+        t = self.clock() - self.start
+        chars, attrs = screen.chars, screen.attrs
+        if (screen.h, screen.w) != self.size or self.frames % self.KEYFRAME == 0:
+            self.size = (screen.h, screen.w)
+            text = "".join(chars).encode("utf-8")
+            kind, payload = b"K", (struct.pack("<HHI", screen.h, screen.w, len(text))
+                                   + text + pack_ints("q", attrs))
+        else:
+            kind, payload = b"D", self._delta(chars, attrs, screen.w)
+        payload = zlib.compress(payload)
+        self.file.write(self.RECORD.pack(kind, t, len(payload)))
+        self.file.write(payload)
+        self.chars, self.attrs = chars[:], attrs[:]
+        self.frames += 1
+
+    def _delta(self, chars, attrs, w):
+        """Runs of cells that changed since the previous frame, row by row."""
+        old_chars, old_attrs = self.chars, self.attrs
+        starts, lengths, run_chars, run_attrs = [], [], [], []
+        for a in range(0, len(chars), w):
+            b = a + w
+            if chars[a:b] == old_chars[a:b] and attrs[a:b] == old_attrs[a:b]:
+                continue
+            i = a
+            while i < b:
+                if chars[i] == old_chars[i] and attrs[i] == old_attrs[i]:
+                    i += 1
+                    continue
+                j = i + 1
+                while j < b and (chars[j] != old_chars[j] or attrs[j] != old_attrs[j]):
+                    j += 1
+                starts.append(i)
+                lengths.append(j - i)
+                run_chars += chars[i:j]
+                run_attrs += attrs[i:j]
+                i = j
+        text = "".join(run_chars).encode("utf-8")
+        return (struct.pack("<II", len(starts), len(text)) + pack_ints("I", starts)
+                + pack_ints("I", lengths) + text + pack_ints("q", run_attrs))
+
+    def close(self):
+        self.file.close()
+
+
+class Recording:
+    """Random access to the frames of a Recorder file."""
+
+    SEEK = 5.0  # seconds skipped by left/right during replay
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        if self.file.read(len(Recorder.MAGIC)) != Recorder.MAGIC:
+            raise ValueError(f"{path} is not an art gallery recording")
+        self.times, self.records = [], []  # per frame: seconds; (kind, offset, size)
+        header = Recorder.RECORD
+        while True:
+            data = self.file.read(header.size)
+            if len(data) < header.size:
+                break  # end of file, or a recording cut short mid-frame
+            kind, t, size = header.unpack(data)
+            self.times.append(t)
+            self.records.append((kind, self.file.tell(), size))
+            self.file.seek(size, 1)
+        end = self.file.seek(0, 2)
+        while self.records and self.records[-1][1] + self.records[-1][2] > end:
+            self.records.pop()  # truncated payload
+            self.times.pop()
+        self.keyframes = [i for i, (kind, _, _) in enumerate(self.records) if kind == b"K"]
+        if not self.keyframes or self.keyframes[0] != 0:
+            raise ValueError(f"{path} has no frames")
+        self.position = -1  # frame currently decoded into h, w, chars, attrs
+        self.h = self.w = 0
+        self.chars, self.attrs = [], []
+
+    def __len__(self):
+        return len(self.records)
+
+    def seek(self, frame):
+        """Decode `frame`, from the last keyframe before it unless the
+        frames since the current one lead there directly."""
+        key = self.keyframes[bisect.bisect_right(self.keyframes, frame) - 1]
+        start = self.position + 1 if key <= self.position < frame else key
+        for i in range(start, frame + 1):
+            self._apply(i)
+        self.position = frame
+
+    def _apply(self, i):
+        kind, offset, size = self.records[i]
+        self.file.seek(offset)
+        data = zlib.decompress(self.file.read(size))
+        if kind == b"K":
+            self.h, self.w, n = struct.unpack_from("<HHI", data)
+            self.chars = list(data[8:8 + n].decode("utf-8"))
+            self.attrs = unpack_ints("q", data[8 + n:]).tolist()
+            return
+        runs, n = struct.unpack_from("<II", data)
+        starts = unpack_ints("I", data[8:8 + 4 * runs])
+        lengths = unpack_ints("I", data[8 + 4 * runs:8 + 8 * runs])
+        body = 8 + 8 * runs
+        text = data[body:body + n].decode("utf-8")
+        attrs = unpack_ints("q", data[body + n:])
+        k = 0
+        for start, length in zip(starts, lengths):
+            self.chars[start:start + length] = text[k:k + length]
+            self.attrs[start:start + length] = attrs[k:k + length]
+            k += length
+
+    def close(self):
+        self.file.close()
+
+
+def run_replay(stdscr, recording, speed):
+    """Play a recording at `speed` times real time (0: as fast as the
+    terminal takes it), looping. Returns (frames shown, seconds).
+
+    Space pauses, left/right seek SEEK seconds, +/- double or halve the
+    speed and q quits.
+    """
+    curses.curs_set(0)
+    stdscr.nodelay(True)
+    init_colors(stdscr)
+    h, w = stdscr.getmaxyx()
+    screen = CellBuffer(h, w)
+    times, last = recording.times, len(recording) - 1
+    clock = time.perf_counter
+    started = now = clock()
+    playhead, frame, shown, paused = times[0], 0, 0, False
     while True:
         key = stdscr.getch()
         if key == ord("q"):
             break
-        elif key == curses.KEY_RIGHT:
-            current = (current + 1) % len(animations)
-        elif key == curses.KEY_LEFT:
-            current = (current - 1) % len(animations)
-        elif ord("1") <= key <= ord("9"):
-            current = key - ord("1")
-        elif key == ord("0"):
-            current = 9
-        elif key == ord(" "):
+        if key == ord(" "):
             paused = not paused
-        elif key == ord("r"):
-            animations[current].reset()
-        elif key == curses.KEY_RESIZE:
-            h, w = stdscr.getmaxyx()
-            ah = h - 1
-            for a in animations:
-                a.resize(ah, w)
-
-        # check for resize even without KEY_RESIZE
+        elif key in (curses.KEY_LEFT, curses.KEY_RIGHT):
+            step = recording.SEEK if key == curses.KEY_RIGHT else -recording.SEEK
+            playhead = min(max(playhead + step, times[0]), times[last])
+            frame = bisect.bisect_right(times, playhead) - 1
+        elif key in (ord("+"), ord("-")) and speed > 0:
+            speed = speed * 2 if key == ord("+") else speed / 2
+
         nh, nw = stdscr.getmaxyx()
         if nh != h or nw != w:
             h, w = nh, nw
-            ah = h - 1
-            for a in animations:
-                a.resize(ah, w)
+            screen.resize(h, w)
+            stdscr.erase()
+            recording.position = -1  # redraw the current frame from scratch
 
+        then, now = now, clock()
         if not paused:
-            animations[current].update()
-
-        stdscr.erase()
-        animations[current].draw(stdscr)
-        draw_status_bar(stdscr, h, w, animations[current].name, current, len(animations), paused)
+            if speed > 0:
+                playhead += (now - then) * speed
+                if playhead > times[last]:
+                    playhead = times[0]  # loop
+                frame = bisect.bisect_right(times, playhead) - 1
+            else:
+                frame = frame + 1 if frame < last else 0
+                playhead = times[frame]
+        if frame == recording.position:
+            time.sleep(0.005)
+            continue
+        recording.seek(frame)
+        screen.erase()
+        rw = recording.w
+        for y in range(min(recording.h, h)):
+            screen.blit(y, 0, recording.chars[y * rw:(y + 1) * rw], recording.attrs[y * rw:(y + 1) * rw])
+        screen.present(stdscr)
         stdscr.refresh()
+        shown += 1
+    return shown, clock() - started
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+BENCH_SIZES = "80x24,200x60,400x120"
+
+
+def parse_size(text):
+    """Parse "WxH" into (h, w)."""
+    try:
+        w, h = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size {text!r}, expected WxH")
+    if w < 2 or h < 3:
+        raise argparse.ArgumentTypeError(f"size {text!r} is too small")
+    return h, w
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    idx = int(round(pct / 100.0 * (len(ordered) - 1)))
+    return ordered[clamp(idx, 0, len(ordered) - 1)]
+
+
+def select_exhibits(names):
+    """Filter EXHIBITS by class or display name (case-insensitive)."""
+    if not names:
+        return list(EXHIBITS)
+    wanted = {n.lower().replace(" ", "") for n in names}
+    chosen = [cls for cls in EXHIBITS
+              if cls.__name__.lower() in wanted
+              or cls.name.lower().replace(" ", "") in wanted]
+    if not chosen:
+        raise SystemExit(f"no exhibit matches {', '.join(names)}")
+    return chosen
+
+
+def bench_exhibit(cls, h, w, has256, frames, warmup):
+    """Time update(), draw() and present() of one exhibit on a headless
+    h x w screen. The terminal is another CellBuffer, so its call count is
+    what curses would receive; the changed-cell count is what it received
+    when every changed cell took an addch() of its own."""
+    screen, terminal = CellBuffer(h, w), CellBuffer(h, w)
+    anim = cls(h - 1, w, has256)
+    incremental = getattr(anim, "incremental", False)
+
+    def frame():
+        anim.update()
+        t1 = clock()
+        if not incremental:
+            screen.erase()
+        anim.draw(screen)
+        t2 = clock()
+        screen.present(terminal)
+        return t1, t2, screen.changed
+
+    clock = time.perf_counter
+    for _ in range(warmup):
+        frame()
+    screen.calls = terminal.calls = changed = 0
+    update_times, draw_times, present_times = [], [], []
+    start = clock()
+    for _ in range(frames):
+        t0 = clock()
+        t1, t2, cells = frame()
+        t3 = clock()
+        changed += cells
+        update_times.append(t1 - t0)
+        draw_times.append(t2 - t1)
+        present_times.append(t3 - t2)
+    elapsed = clock() - start
+    return {
+        "fps": frames / elapsed if elapsed > 0 else float("inf"),
+        "update_p50": percentile(update_times, 50),
+        "update_p99": percentile(update_times, 99),
+        "draw_p50": percentile(draw_times, 50),
+        "draw_p99": percentile(draw_times, 99),
+        "present_p50": percentile(present_times, 50),
+        "draw_calls": screen.calls / frames,
+        "changed_cells": changed / frames,
+        "curses_calls": terminal.calls / frames,
+    }
+
+
+def run_benchmark(args):
+    use_headless_colors()
+    seed_exhibits(args.seed if args.seed is not None else 1)
+    has256 = not args.basic_colors
+    print(f"backend: {'numpy' if np is not None else 'python'}")
+    header = (f"{'exhibit':<18} {'size':>8} {'fps':>9} "
+              f"{'upd p50':>9} {'upd p99':>9} {'draw p50':>9} {'draw p99':>9} "
+              f"{'out p50':>9} {'calls/f':>8} {'cells/f':>8} {'curses/f':>8}")
+    print(header)
+    print("-" * len(header))
+    for cls in select_exhibits(args.exhibit):
+        for h, w in args.sizes:
+            r = bench_exhibit(cls, h, w, has256, args.frames, args.warmup)
+            print(f"{cls.name:<18} {f'{w}x{h}':>8} {r['fps']:>9.1f} "
+                  f"{r['update_p50'] * 1e3:>7.2f}ms {r['update_p99'] * 1e3:>7.2f}ms "
+                  f"{r['draw_p50'] * 1e3:>7.2f}ms {r['draw_p99'] * 1e3:>7.2f}ms "
+                  f"{r['present_p50'] * 1e3:>7.2f}ms "
+                  f"{r['draw_calls']:>8.0f} {r['changed_cells']:>8.0f} "
+                  f"{r['curses_calls']:>8.0f}",
+                  flush=True)
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+class AnsiTerminal:
+    """Stand-in for stdscr that turns CellBuffer.present() output into ANSI
+    escape sequences, for exported recordings.
+
+    Attributes are decoded as headless color pairs (see use_headless_colors)
+    and mapped to the colors init_colors() gives those pairs.
+    """
+
+    def __init__(self, has256):
+        self.colors = {i: f"3{i}" for i in range(1, 8)}
+        if has256:
+            for first, colors in PALETTES.values():
+                self.colors.update((first + i, f"38;5;{c}") for i, c in enumerate(colors))
+        self.styles = {}  # attr -> SGR sequence
+        self.out = []
+        self.cursor = self.style = None  # skipped when a run continues where the last ended
+
+    def _style(self, attr):
+        codes = ["0"]
+        if attr & curses.A_BOLD:
+            codes.append("1")
+        if attr & curses.A_REVERSE:
+            codes.append("7")
+        color = self.colors.get((attr & curses.A_COLOR) >> 8)
+        if color:
+            codes.append(color)
+        style = self.styles[attr] = f"\x1b[{';'.join(codes)}m"
+        return style
+
+    def addstr(self, y, x, s, attr=0):
+        out = self.out
+        if self.cursor != (y, x):
+            out.append(f"\x1b[{y + 1};{x + 1}H")
+        style = self.styles.get(attr) or self._style(attr)
+        if style != self.style:
+            out.append(style)
+            self.style = style
+        out.append(s)
+        self.cursor = (y, x + len(s))
+
+    def take(self):
+        """Everything written since the last call, as one string."""
+        data = "".join(self.out)
+        self.out.clear()
+        return data
+
+
+def exhibit_frames(cls, h, w, has256, frames):
+    """Run an exhibit headlessly, yielding the ANSI output of each frame."""
+    anim = cls(h, w, has256)
+    incremental = getattr(anim, "incremental", False)
+    screen, terminal = CellBuffer(h, w), AnsiTerminal(has256)
+    for _ in range(frames):
+        anim.update()
+        if not incremental:
+            screen.erase()
+        anim.draw(screen)
+        screen.present(terminal)
+        yield terminal.take()
+
+
+def write_asciicast(out, chunks, h, w, title):
+    """Stream ANSI chunks as asciicast v2 events, one per simulation step."""
+    header = {"version": 2, "width": w, "height": h, "timestamp": int(time.time()),
+              "title": title, "env": {"TERM": "xterm-256color"}}
+    out.write(json.dumps(header) + "\n")
+    for i, data in enumerate(chunks):
+        out.write(json.dumps([round(i / FrameScheduler.SIM_HZ, 6), "o", data]) + "\n")
+
+
+def write_ansi(out, chunks, h, w, title):
+    """Stream ANSI chunks back to back, e.g. for cat or a serial console."""
+    out.write("\x1b[?25l\x1b[2J")  # hide the cursor, clear the screen
+    for data in chunks:
+        out.write(data)
+    out.write("\x1b[0m\x1b[?25h")
+
+
+EXPORT_FORMATS = {"cast": write_asciicast, "ansi": write_ansi}
+
+
+def export_exhibit(job):
+    """Export one exhibit at one size; returns (name, size, frames, seconds, path)."""
+    name, h, w, has256, frames, fmt, path = job
+    cls = next(c for c in EXHIBITS if c.__name__ == name)
+    chunks = exhibit_frames(cls, h, w, has256, frames)
+    start = time.perf_counter()
+    with open(path, "w", encoding="utf-8") as out:
+        EXPORT_FORMATS[fmt](out, chunks, h, w, cls.name)
+    return cls.name, f"{w}x{h}", frames, time.perf_counter() - start, path
+
+
+def export_worker(args):
+    """Pool initializer: apply the command line in a worker process."""
+    use_headless_colors()
+    configure(args)
+
+
+def run_export(args):
+    use_headless_colors()
+    has256 = not args.basic_colors
+    jobs = [(cls.__name__, h, w, has256, args.frames, args.export,
+             os.path.join(args.out, f"{cls.__name__.lower()}-{w}x{h}.{args.export}"))
+            for cls in select_exhibits(args.exhibit) for h, w in args.sizes]
+    os.makedirs(args.out, exist_ok=True)
+    start = time.perf_counter()
+    if args.jobs > 1 and len(jobs) > 1:
+        import multiprocessing
+        with multiprocessing.get_context("spawn").Pool(
+                min(args.jobs, len(jobs)), export_worker, (args,)) as pool:
+            results = pool.imap_unordered(export_exhibit, jobs)
+            report_exports(results)
+    else:
+        report_exports(map(export_exhibit, jobs))
+    elapsed = time.perf_counter() - start
+    total = args.frames * len(jobs)
+    print(f"{total} frames in {elapsed:.2f}s ({total / elapsed:.1f} frames/s overall)")
+    return 0
+
+
+def report_exports(results):
+    for name, size, frames, secs, path in results:
+        print(f"{name:<18} {size:>8} {frames / secs:>9.1f} frames/s  {path}", flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Interactive terminal art gallery.")
+    parser.add_argument("--bench", action="store_true",
+                        help="run every exhibit headlessly and report timings")
+    parser.add_argument("--sizes", default=BENCH_SIZES,
+                        type=lambda s: [parse_size(v) for v in s.split(",") if v],
+                        help=f"comma-separated WxH screen sizes (default {BENCH_SIZES})")
+    parser.add_argument("--frames", type=int, default=200,
+                        help="timed frames per exhibit and size (default 200)")
+    parser.add_argument("--warmup", type=int, default=20,
+                        help="untimed frames before measuring (default 20)")
+    parser.add_argument("--exhibit", action="append", metavar="NAME",
+                        help="only benchmark this exhibit (repeatable)")
+    parser.add_argument("--export", choices=sorted(EXPORT_FORMATS),
+                        help="render --frames frames of each --exhibit at each of --sizes "
+                             "to asciicast v2 (cast) or raw ANSI files, unthrottled")
+    parser.add_argument("--out", default=".", metavar="DIR",
+                        help="directory for --export files (default: current)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="exhibits exported in parallel (default: one per CPU)")
+    parser.add_argument("--basic-colors", action="store_true",
+                        help="benchmark the 8-color code paths")
+    parser.add_argument("--seed", type=int,
+                        help="seed every exhibit's random stream, for reproducible runs "
+                             "(default: from the OS; 1 for --bench)")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record every frame shown to FILE for --replay")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play back a recording instead of running the exhibits")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed, 0 for as fast as possible (default 1)")
+    parser.add_argument("--stats-file", metavar="PATH",
+                        help=f"append performance stats as a JSON line every "
+                             f"{StatsFile.INTERVAL:g}s (the p key shows them on screen)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="time each startup stage up to the first frame, then exit")
+    parser.add_argument("--fps", type=float, default=FrameScheduler.FPS,
+                        help=f"most frames rendered per second (default {FrameScheduler.FPS}); "
+                             f"exhibits always update {FrameScheduler.SIM_HZ} times a second")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="simulate and draw exhibits in a worker process while "
+                             "this one writes frames to the terminal")
+    parser.add_argument("--idle-release", type=float, metavar="SECONDS", default=Gallery.IDLE_RELEASE,
+                        help="free exhibits that have not been shown for this long; they "
+                             "restart when shown again (default: never)")
+    parser.add_argument("--life-engine", choices=sorted(GameOfLife.ENGINES),
+                        default=GameOfLife.ENGINE,
+                        help=f"Game of Life engine (default {GameOfLife.ENGINE})")
+    parser.add_argument("--life-world", type=parse_size, metavar="WxH",
+                        help="run Game of Life on a WxH world larger than the screen, e.g. 4096x4096")
+    parser.add_argument("--voronoi-seeds", type=int, metavar="N",
+                        help="number of Voronoi seeds (default 12-16)")
+    parser.add_argument("--boids", type=int, metavar="N", default=FluidParticles.BOIDS,
+                        help=f"number of Fluid Particles boids (default {FluidParticles.BOIDS})")
+    parser.add_argument("--ripples", type=int, metavar="N", default=RaindropRipples.RIPPLES,
+                        help=f"most Raindrop Ripples alive at once (default {RaindropRipples.RIPPLES})")
+    parser.add_argument("--firework-particles", type=int, metavar="N", default=0,
+                        help="stress mode: keep at least N Fireworks particles alive")
+    parser.add_argument("--spirograph-points", type=int, metavar="N", default=Spirograph.POINTS,
+                        help=f"Spirograph points plotted per curve per frame (default {Spirograph.POINTS})")
+    parser.add_argument("--spirograph-trail", type=int, metavar="FRAMES", default=Spirograph.TRAIL,
+                        help=f"frames a Spirograph point stays visible (default {Spirograph.TRAIL})")
+    parser.add_argument("--terrain", choices=("waves", "noise"), default=TerrainMap.MODE,
+                        help=f"Terrain Map height field (default {TerrainMap.MODE})")
+    parser.add_argument("--maze", choices=("backtrack", "eller"), default=MazeGenerator.MODE,
+                        help=f"Maze Generator algorithm (default {MazeGenerator.MODE})")
+    parser.add_argument("--maze-size", type=parse_size, metavar="WxH",
+                        help="Maze Generator size in maze cells (default: fit the screen)")
+    parser.add_argument("--numpy", action="store_true",
+                        help="vectorize the grid-based exhibits with NumPy if installed")
+    args = parser.parse_args(argv)
+    if args.frames < 1:
+        parser.error("--frames must be at least 1")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.fps <= 0:
+        parser.error("--fps must be positive")
+    if args.idle_release < 0:
+        parser.error("--idle-release cannot be negative")
+    if args.speed < 0:
+        parser.error("--speed cannot be negative")
+    if args.replay and (args.record or args.pipeline):
+        parser.error("--replay cannot be combined with --record or --pipeline")
+    if args.pipeline and args.startup_profile:
+        parser.error("--startup-profile cannot be combined with --pipeline")
+    if args.pipeline and sys.version_info < (3, 8):
+        parser.error("--pipeline needs Python 3.8 or newer")
+    if args.life_world and args.life_engine != "bitset":
+        parser.error("--life-world has its own engine and cannot be combined with --life-engine")
+    if args.voronoi_seeds is not None and args.voronoi_seeds < 1:
+        parser.error("--voronoi-seeds must be at least 1")
+    if args.boids < 1:
+        parser.error("--boids must be at least 1")
+    if args.ripples < 1:
+        parser.error("--ripples must be at least 1")
+    if args.spirograph_points < 1 or args.spirograph_trail < 1:
+        parser.error("--spirograph-points and --spirograph-trail must be at least 1")
+    if args.firework_particles < 0:
+        parser.error("--firework-particles cannot be negative")
+    return args
+
+
+def configure(args):
+    """Apply exhibit tunables from the command line."""
+    FrameScheduler.FPS = args.fps
+    seed_exhibits(args.seed)
+    Gallery.IDLE_RELEASE = args.idle_release
+    GameOfLife.ENGINE = args.life_engine
+    GameOfLife.WORLD = args.life_world
+    VoronoiLandscape.SEEDS = args.voronoi_seeds
+    FluidParticles.BOIDS = args.boids
+    RaindropRipples.RIPPLES = args.ripples
+    TerrainMap.MODE = args.terrain
+    MazeGenerator.MODE = args.maze
+    MazeGenerator.SIZE = args.maze_size
+    Fireworks.PARTICLES = args.firework_particles
+    Spirograph.POINTS = args.spirograph_points
+    Spirograph.TRAIL = args.spirograph_trail
+    if args.numpy and not enable_numpy():
+        print("NumPy is not installed; using the pure-Python exhibits.", file=sys.stderr)
+
+
+def run(argv=None):
+    imported = time.perf_counter()
+    args = parse_args(argv)
+    configure(args)
+    if args.bench:
+        return run_benchmark(args)
+    if args.export:
+        return run_export(args)
+    if args.replay:
+        try:
+            recording = Recording(args.replay)
+        except (OSError, ValueError) as e:
+            print(f"art_gallery: {e}", file=sys.stderr)
+            return 1
+        try:
+            frames, secs = curses.wrapper(run_replay, recording, args.speed)
+        finally:
+            recording.close()
+        print(f"replayed {frames} frames in {secs:.1f}s ({frames / max(secs, 1e-9):.1f} fps)")
+        return 0
+    profile = StartupProfile(imported) if args.startup_profile else None
+    if profile:
+        profile.mark("arguments and configure")
+    curses.wrapper(main, args, profile)
+    if profile:
+        profile.report()
+    return 0
 
 
 if __name__ == "__main__":
-    curses.wrapper(main)
+    sys.exit(run())